@@ -6,7 +6,19 @@ import streamlit as st
 import mysql.connector
 from qdrant_client import QdrantClient
 import google.generativeai as genai
+import hashlib
+import heapq
 import logging
+import operator
+import os
+import re
+import sqlite3
+import string
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 import pandas as pd
 
 # Import configuration and error handling
@@ -21,11 +33,93 @@ from error_handler import (
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+class LRUCache:
+    """Small thread-safe LRU cache with per-key invalidation and optional expiry"""
+
+    def __init__(self, maxsize: int, ttl: float = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when key is None"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+class ResponseStore:
+    """LLM responses persisted in SQLite by prompt hash, so a restarted process starts warm"""
+
+    def __init__(self, path: str, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(prompt_hash BLOB PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.execute("DELETE FROM responses WHERE ts < ?", (int(time.time() - ttl),))
+
+    @staticmethod
+    def _key(prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, prompt: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE prompt_hash = ? AND ts >= ?",
+                (self._key(prompt), int(time.time() - self.ttl)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, prompt: str, response: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (prompt_hash, response, ts) VALUES (?, ?, ?)",
+                (self._key(prompt), response, int(time.time())),
+            )
+
+@st.cache_resource
+def shared_cache(name: str, maxsize: int, ttl: float = None):
+    """An LRUCache that outlives reruns (Streamlit re-executes this script with fresh globals)"""
+    return LRUCache(maxsize, ttl)
+
 @st.cache_resource
 def get_qdrant():
     try:
         logger.info("Initializing Qdrant connection...")
-        client = QdrantClient(url=config.QDRANT_URL, api_key=config.QDRANT_API_KEY)
+        client = QdrantClient(
+            url=config.QDRANT_URL,
+            api_key=config.QDRANT_API_KEY,
+            prefer_grpc=config.QDRANT_PREFER_GRPC,
+            timeout=config.REQUEST_TIMEOUT,
+        )
         logger.info("Qdrant connection established")
         return client
     except Exception as e:
@@ -42,8 +136,10 @@ def get_db_pool():
         db_config = config.get_db_config()
         pool = pooling.MySQLConnectionPool(
             pool_name="streamlit_pool",
-            pool_size=5,
-            pool_reset_session=True,
+            pool_size=config.DB_POOL_SIZE,
+            # Read-only autocommit queries leave no session state behind, so skip
+            # the COM_RESET_CONNECTION round trip every time a connection is returned
+            pool_reset_session=False,
             **db_config
         )
         logger.info("Cloud SQL connection pool established")
@@ -53,23 +149,39 @@ def get_db_pool():
         raise DatabaseConnectionError(f"Could not create database pool: {str(e)}")
 
 def get_db_connection():
-    """Get a fresh connection from the pool with automatic retry"""
+    """
+    Get a live connection from the pool, waiting briefly if every connection is checked out
+
+    The pool itself pings each connection on checkout and reconnects stale ones,
+    so no further is_connected() round trip is needed here.
+    """
     pool = get_db_pool()
+    deadline = time.monotonic() + config.DB_POOL_WAIT
     try:
-        conn = pool.get_connection()
-        if not conn.is_connected():
-            conn.reconnect(attempts=3, delay=1)
-        return conn
+        while True:
+            try:
+                return pool.get_connection()
+            except mysql.connector.errors.PoolError:
+                # Exhausted: other sessions hand theirs back within one recommendation
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
     except Exception as e:
         logger.error(f"Failed to get connection from pool: {str(e)}")
         raise DatabaseConnectionError(f"Could not get database connection: {str(e)}")
 
+# Every prompt asks for one or two sentences: stop at the first paragraph break
+# instead of paying for anything after it. max_output_tokens stays generous
+# because gemini-2.5 models spend part of it on internal reasoning.
+GENERATION_CONFIG = {"temperature": 0.1, "max_output_tokens": 1024, "stop_sequences": ["\n\n"]}
+
 @st.cache_resource
 def get_gemini_model():
     try:
         logger.info("Initializing Gemini AI...")
         genai.configure(api_key=config.GEMINI_API_KEY)
-        model = genai.GenerativeModel(config.GEMINI_MODEL)
+        # Bound once here, so generate_content() has no per-call config to convert
+        model = genai.GenerativeModel(config.GEMINI_MODEL, generation_config=GENERATION_CONFIG)
         logger.info("Gemini AI initialized")
         return model
     except Exception as e:
@@ -77,46 +189,262 @@ def get_gemini_model():
         st.error(f"AI service unavailable: {str(e)}")
         return None
 
+@st.cache_resource
+def warm_up_services():
+    """
+    Initialize Qdrant, the DB pool and Gemini once per process
+
+    The cached getters run on the script thread, where Streamlit can report their
+    errors; only the Gemini handshake (a free count_tokens call, which needs no
+    Streamlit context) runs on a worker thread, overlapping the other two.
+    """
+    model = get_gemini_model()
+    handshake = get_io_executor().submit(model.count_tokens, ".") if model is not None else None
+    for name, init in (("Qdrant", get_qdrant), ("Cloud SQL", get_db_pool)):
+        try:
+            init()
+        except Exception as e:
+            # Not cached: the first real call retries and reports the error
+            logger.warning("%s warm-up failed: %s", name, e)
+    if handshake is not None and handshake.exception() is not None:
+        logger.warning("Gemini warm-up failed: %s", handshake.exception())
+    return True
+
+@st.cache_resource
+def get_io_executor():
+    """Shared worker threads for overlapping independent network calls"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="stockright-io")
+
+# Temporary areas (floor, receiving, order staging) are not storage locations
+_TEMP_PREFIXES = ("FLOOR", "REC", "ORD")
+# Subdivided locations end in a doubled letter (e.g. TN52DD)
+_DOUBLED_LETTERS = frozenset(c * 2 for c in string.ascii_letters)
+
+# Plain startswith/frozenset checks: cheaper per call than one precompiled regex
 def is_valid_location(location_code):
     if not location_code: return False
-    if location_code.startswith(("FLOOR", "REC", "ORD")): return False
-    if len(location_code) >= 2:
-        last_two = location_code[-2:]
-        if last_two.isalpha() and last_two[0] == last_two[1]:
-            return False
+    if location_code.startswith(_TEMP_PREFIXES): return False
+    if location_code[-2:] in _DOUBLED_LETTERS: return False
     return True
 
+# Hot locations are checked again and again within seconds; a few seconds of
+# staleness is fine for an advisory recommendation
+_location_status_cache = shared_cache("location_status", config.LOCATION_CACHE_SIZE, ttl=config.LOCATION_STATUS_TTL)
+
+# Codes per IN (...) query, well under max_allowed_packet
+STATUS_BATCH_SIZE = 500
+
+# Recommended supporting index (covers both the IN (...) lookup and the clientId read,
+# so the status check is answered from the index without touching table rows):
+# CREATE INDEX idx_location_code_client ON location (code, clientId);
+_STATUS_SQL = "SELECT code, clientId FROM location WHERE code IN ({})"
+# Every batch but the last is full, so they all share one prebuilt statement
+_FULL_BATCH_STATUS_SQL = _STATUS_SQL.format(",".join(["%s"] * STATUS_BATCH_SIZE))
+
+def _location_status_sql(n):
+    """SELECT text for an n-code status batch"""
+    if n == STATUS_BATCH_SIZE:
+        return _FULL_BATCH_STATUS_SQL
+    return _STATUS_SQL.format(",".join(["%s"] * n))
+
+def _status_key(code):
+    """Compare codes like location.code's case-insensitive, trailing-space-padded collation"""
+    return code.rstrip().upper()
+
+def check_locations_availability(location_codes, cursor):
+    """Return {code: FREE/OCCUPIED/UNKNOWN}, querying all uncached codes with batched IN (...) lookups"""
+    statuses = {}
+    misses = []
+    for code in dict.fromkeys(location_codes):
+        status = _location_status_cache.get(code)
+        if status is None:
+            misses.append(code)
+        else:
+            statuses[code] = status
+    for i in range(0, len(misses), STATUS_BATCH_SIZE):
+        batch = misses[i:i + STATUS_BATCH_SIZE]
+        cursor.execute(_location_status_sql(len(batch)), batch)
+        # Iterate the cursor directly: rows are consumed as they are read, no fetchall() list.
+        # Returned codes are matched the way the column collation compares them, and the
+        # first row per code wins, as with the former one-code "=" lookup and fetchone()
+        found = {}
+        for code, client_id in cursor:
+            found.setdefault(_status_key(code), "FREE" if client_id is None else "OCCUPIED")
+        for code in batch:
+            status = found.get(_status_key(code), "UNKNOWN")
+            _location_status_cache.set(code, status)
+            statuses[code] = status
+    return statuses
+
 def check_location_availability(location_code, cursor):
-    cursor.execute("SELECT clientId FROM location WHERE code = %s", (location_code,))
-    result = cursor.fetchone()
-    if not result: return "UNKNOWN"
-    return "FREE" if result[0] is None else "OCCUPIED"
+    return check_locations_availability([location_code], cursor)[location_code]
+
+def invalidate_location(location_code=None):
+    """Forget the cached status of a location (or all locations) once it is assigned"""
+    _location_status_cache.invalidate(location_code)
+
+# Learned patterns only change when the knowledge base is rebuilt, so payloads
+# are cached per part id (read-only, since every caller shares the same object);
+# the TTL bounds how long a rebuild takes to show up in a long-running process
+_part_cache = shared_cache("qdrant_parts", config.PART_CACHE_SIZE, ttl=config.PART_INFO_TTL)
+
+# Ids per retrieve call, keeping each request well inside Qdrant's size limits
+QDRANT_BATCH_SIZE = 256
 
 @retry_on_failure(max_retries=config.MAX_RETRIES, delay=1.0)
-def get_part_from_qdrant(qdrant, part_id):
+def _fetch_parts_from_qdrant(qdrant, part_ids):
     try:
-        results = qdrant.retrieve(collection_name=config.QDRANT_COLLECTION_NAME, ids=[part_id])
-        return results[0].payload if results else None
+        results = qdrant.retrieve(
+            collection_name=config.QDRANT_COLLECTION_NAME, ids=part_ids, with_payload=True, with_vectors=False
+        )
+        return {r.id: MappingProxyType(r.payload) for r in results}
     except Exception as e:
-        logger.error(f"Qdrant retrieval error for part {part_id}: {str(e)}")
+        logger.error(f"Qdrant retrieval error for parts {part_ids}: {str(e)}")
         raise
 
+def get_parts_from_qdrant(qdrant, part_ids):
+    """Return {part_id: payload or None}, fetching cache misses QDRANT_BATCH_SIZE ids per retrieve call"""
+    payloads = {}
+    misses = []
+    for part_id in dict.fromkeys(part_ids):
+        payload = _part_cache.get(part_id, _MISSING)
+        if payload is _MISSING:
+            misses.append(part_id)
+        else:
+            payloads[part_id] = payload
+    for i in range(0, len(misses), QDRANT_BATCH_SIZE):
+        batch = misses[i:i + QDRANT_BATCH_SIZE]
+        fetched = _fetch_parts_from_qdrant(qdrant, batch)
+        for part_id in batch:
+            payload = fetched.get(part_id)
+            # Parts without a learned pattern are not cached, so a rebuilt
+            # knowledge base is picked up on the very next lookup
+            if payload is not None:
+                _part_cache.set(part_id, payload)
+            payloads[part_id] = payload
+    return payloads
+
+def get_part_from_qdrant(qdrant, part_id):
+    return get_parts_from_qdrant(qdrant, [part_id])[part_id]
+
+def invalidate_part_cache(part_id=None):
+    """Forget the cached payload for part_id (or all parts) after the pattern is updated"""
+    _part_cache.invalidate(part_id)
+
+# Part rows and client names rarely change, and operators re-enter the same
+# part often; within PART_INFO_TTL the lookup is served from memory
+_part_row_cache = shared_cache("part_rows", config.PART_CACHE_SIZE, ttl=config.PART_INFO_TTL)
+
+def fetch_part_row(part_id, cursor):
+    """(code, description, clientId, client name) for part_id in one round trip, or None if there is no such part"""
+    row = _part_row_cache.get(part_id, _MISSING)
+    if row is _MISSING:
+        cursor.execute(
+            "SELECT p.code, p.description, p.clientId, c.name "
+            "FROM part p LEFT JOIN client c ON c.id = p.clientId "
+            "WHERE p.id = %s",
+            (part_id,),
+        )
+        row = cursor.fetchone()
+        # Unknown ids are not cached: a part created moments ago must be found
+        if row is not None:
+            _part_row_cache.set(part_id, row)
+    return row
+
+def invalidate_part_info(part_id=None):
+    """Forget the cached part row for part_id (or all parts) after it is edited"""
+    _part_row_cache.invalidate(part_id)
+
+# Prompts are built only from the part, client, location and usage bucket, so
+# repeat recommendations produce the exact same prompt; successful responses
+# are reused instead of paying another Gemini round trip
+_gemini_cache = shared_cache("gemini", config.GEMINI_CACHE_SIZE)
+
+@st.cache_resource
+def get_response_store():
+    """On-disk second tier behind _gemini_cache (None when disabled or unavailable)"""
+    if not config.GEMINI_CACHE_DB:
+        return None
+    try:
+        os.makedirs(os.path.dirname(config.GEMINI_CACHE_DB) or ".", exist_ok=True)
+        return ResponseStore(config.GEMINI_CACHE_DB, ttl=config.GEMINI_CACHE_DB_TTL)
+    except Exception as e:
+        logger.warning(f"Persistent Gemini cache disabled: {str(e)}")
+        return None
+
 def call_gemini(model, prompt):
+    cached = _gemini_cache.get(prompt)
+    if cached is not None:
+        return cached
+    store = get_response_store()
+    if store is not None:
+        cached = store.get(prompt)
+        if cached is not None:
+            _gemini_cache.set(prompt, cached)
+            return cached
     try:
-        response = model.generate_content(
-            prompt,
-            generation_config={"temperature": 0.1, "max_output_tokens": 1024},
-        )
+        response = model.generate_content(prompt)
         if response.candidates and response.candidates[0].content.parts:
-            return response.candidates[0].content.parts[0].text
+            text = response.candidates[0].content.parts[0].text
+            _gemini_cache.set(prompt, text)
+            if store is not None:
+                store.set(prompt, text)
+            return text
     except Exception:
         pass
     return None
 
+_RECOMMENDATION_PROMPT = (
+    "You are a warehouse management assistant. "
+    "Part '{part_code}' for client '{client_name}' needs to be stored in the warehouse. "
+    "Location '{code}' is the {emphasis} for this part ({detail}) and is currently FREE and available for immediate use. "
+    "\n\nWrite a clear, confident recommendation in 1-2 sentences that: "
+    "1. States that location {code} is recommended "
+    "2. Emphasizes it is FREE and ready to use RIGHT NOW "
+    "3. Mentions it follows historical patterns (without stating exact numbers) "
+    "Keep it professional and direct."
+)
+
+# (emphasis, detail) wording for each usage bucket
+_USAGE_WORDING = {
+    "high": ("most preferred location", "used for majority (~{percentage}%) of putaways"),
+    "good": ("frequently used location", "commonly used (~{percentage}% of times)"),
+    "mod": ("historically used location", "previously used multiple times"),
+    "low": ("available location from historical patterns", "based on available historical data"),
+}
+
+# One bound str.format per bucket, with the bucket wording baked in at import
+RECOMMENDATION_PROMPTS = {
+    bucket: _RECOMMENDATION_PROMPT.replace("{emphasis}", emphasis).replace("{detail}", detail).format
+    for bucket, (emphasis, detail) in _USAGE_WORDING.items()
+}
+
+# Prompt for when every historical location is taken, bound once like the above
+OCCUPIED_PROMPT = (
+    "You are a warehouse management assistant. "
+    "All previously used warehouse shelf locations for part '{part_code}' ({description}) "
+    "belonging to client '{client_name}' are currently occupied. The preferred warehouse zone is {zone}. "
+    "In one sentence, advise the warehouse operator what to do next."
+).format
+
+# Percentages are binned before they go into a prompt (the response must not quote
+# exact numbers anyway), so near-identical usage shapes share one cached response
+PROMPT_PERCENT_BIN = 5
+
+def usage_bucket(percentage, count):
+    """Classify the top location's historical usage into a prompt bucket"""
+    if percentage >= 50: return "high"
+    if percentage >= 20: return "good"
+    if count >= 5: return "mod"
+    return "low"
+
 def get_recommendation(part_id: int):
     qdrant = get_qdrant()
     model = get_gemini_model()
 
+    # The Qdrant lookup only needs part_id, so it runs while MySQL resolves the part
+    qdrant_future = get_io_executor().submit(get_part_from_qdrant, qdrant, part_id)
+
     # Get a fresh connection from the pool
     db = get_db_connection()
     cursor = None
@@ -124,16 +452,12 @@ def get_recommendation(part_id: int):
     try:
         cursor = db.cursor()
 
-        cursor.execute("SELECT id, code, description, clientId FROM part WHERE id = %s", (part_id,))
-        row = cursor.fetchone()
+        row = fetch_part_row(part_id, cursor)
         if not row:
             return {"error": f"Part {part_id} not found in database."}
 
-        _, part_code, description, client_id = row
-
-        cursor.execute("SELECT name FROM client WHERE id = %s", (client_id,))
-        client_row = cursor.fetchone()
-        client_name = client_row[0] if client_row else f"Client {client_id}"
+        part_code, description, client_id, client_name = row
+        client_name = client_name or f"Client {client_id}"
 
         part_info = {
             "part_id": part_id,
@@ -143,7 +467,7 @@ def get_recommendation(part_id: int):
             "client_id": client_id,
         }
 
-        qdrant_data = get_part_from_qdrant(qdrant, part_id)
+        qdrant_data = qdrant_future.result()
 
         if not qdrant_data or not qdrant_data.get("all_locations"):
             zone = qdrant_data.get("primary_zone") if qdrant_data else None
@@ -157,59 +481,35 @@ def get_recommendation(part_id: int):
                 ),
             }
 
-        locations = qdrant_data["all_locations"]
-        available = []
-        for loc in locations:
-            code = loc.get("code")
-            if not is_valid_location(code):
-                continue
-            if check_location_availability(code, cursor) == "FREE":
-                available.append(
-                    {"code": code, "count": loc.get("count", 0), "percentage": loc.get("percentage", 0)}
-                )
+        locations = [loc for loc in qdrant_data["all_locations"] if is_valid_location(loc.get("code"))]
+        statuses = check_locations_availability([loc["code"] for loc in locations], cursor)
+        available = [
+            {"code": loc["code"], "count": loc.get("count", 0), "percentage": loc.get("percentage", 0)}
+            for loc in locations
+            if statuses[loc["code"]] == "FREE"
+        ]
 
-        available.sort(key=lambda x: -x["count"])
         total_putaways = qdrant_data.get("total_putaways", 0)
 
         if not available:
             zone = qdrant_data.get("primary_zone", "Unknown")
-            prompt = (
-                f"You are a warehouse management assistant. "
-                f"All previously used warehouse shelf locations for part '{part_code}' ({description}) "
-                f"belonging to client '{client_name}' are currently occupied. The preferred warehouse zone is {zone}. "
-                f"In one sentence, advise the warehouse operator what to do next."
-            )
-            ai_text = call_gemini(model, prompt) or (
+            fallback = (
                 f"All historical locations are occupied — consult your supervisor "
                 f"and look for a free location in Zone {zone}."
             )
+            if config.LLM_ONLY_FOR_LOW_CONFIDENCE:
+                # The advice is always "find a free slot in the preferred zone"; the template says it
+                ai_text = fallback
+            else:
+                prompt = OCCUPIED_PROMPT(part_code=part_code, description=description, client_name=client_name, zone=zone)
+                ai_text = call_gemini(model, prompt) or fallback
             return {**part_info, "status": "all_occupied", "ai_summary": ai_text, "zone": zone}
 
-        best = available[0]
-
-        if best['percentage'] >= 50:
-            emphasis = "most preferred location"
-            detail = f"used for majority ({best['percentage']:.1f}%) of putaways"
-        elif best['percentage'] >= 20:
-            emphasis = "frequently used location"
-            detail = f"commonly used ({best['percentage']:.1f}% of times)"
-        elif best['count'] >= 5:
-            emphasis = "historically used location"
-            detail = f"previously used multiple times"
-        else:
-            emphasis = "available location from historical patterns"
-            detail = "based on available historical data"
-
-        prompt = (
-            f"You are a warehouse management assistant. "
-            f"Part '{part_code}' for client '{client_name}' needs to be stored in the warehouse. "
-            f"Location '{best['code']}' is the {emphasis} for this part ({detail}) and is currently FREE and available for immediate use. "
-            f"\n\nWrite a clear, confident recommendation in 1-2 sentences that: "
-            f"1. States that location {best['code']} is recommended "
-            f"2. Emphasizes it is FREE and ready to use RIGHT NOW "
-            f"3. Mentions it follows historical patterns (without stating exact numbers) "
-            f"Keep it professional and direct."
-        )
+        # Only the best location and three alternatives are shown; all_available keeps
+        # the stored pattern order (already ranked by frequency)
+        best, *alternatives = heapq.nlargest(4, available, key=operator.itemgetter("count"))
+
+        bucket = usage_bucket(best['percentage'], best['count'])
 
         if best['percentage'] >= 30:
             fallback = (
@@ -222,7 +522,15 @@ def get_recommendation(part_id: int):
                 f"The location is currently FREE and available for use."
             )
 
-        ai_text = call_gemini(model, prompt) or fallback
+        if config.LLM_ONLY_FOR_LOW_CONFIDENCE and bucket in ("high", "good"):
+            # Strong patterns: the template is the answer, no need to wait on Gemini
+            ai_text = fallback
+        else:
+            prompt = RECOMMENDATION_PROMPTS[bucket](
+                part_code=part_code, client_name=client_name, code=best['code'],
+                percentage=round(best['percentage'] / PROMPT_PERCENT_BIN) * PROMPT_PERCENT_BIN,
+            )
+            ai_text = call_gemini(model, prompt) or fallback
 
         audit_logger.log_recommendation(
             part_id=part_id,
@@ -231,16 +539,17 @@ def get_recommendation(part_id: int):
             status="FREE",
             usage_count=best['count'],
             usage_percentage=best['percentage'],
-            alternatives=[a['code'] for a in available[1:4]]
+            alternatives=[a['code'] for a in alternatives]
         )
 
-        logger.info(f"Recommendation generated for Part {part_code}: {best['code']}")
+        # Lazy %-args: once per request, and usually filtered out above INFO
+        logger.info("Recommendation generated for Part %s: %s", part_code, best['code'])
 
         return {
             **part_info,
             "status": "ok",
             "recommended": best,
-            "alternatives": available[1:4],
+            "alternatives": alternatives,
             "all_available": available,
             "total_putaways": total_putaways,
             "ai_summary": ai_text,
@@ -259,7 +568,10 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-st.markdown("""
+# Connect to all services up front, in parallel, instead of serially on the first request
+warm_up_services()
+
+_APP_CSS = """
 <style>
     /* Dark grey background */
     .stApp {
@@ -520,7 +832,15 @@ st.markdown("""
         margin-top: 1.5rem !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def app_css():
+    """Page stylesheet, minified once per process (it is re-sent with every rerun)"""
+    css = re.sub(r"/\*.*?\*/", "", _APP_CSS, flags=re.S)
+    return re.sub(r"\s*\n\s*", " ", css).strip()
+
+st.markdown(app_css(), unsafe_allow_html=True)
 
 st.markdown("""
 <div style="text-align: center; padding: 2.5rem 2rem; background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 50%, #06b6d4 100%); border-radius: 16px; margin-bottom: 2rem; box-shadow: 0 8px 32px rgba(59, 130, 246, 0.4); border: 1px solid rgba(255,255,255,0.1);">
@@ -610,37 +930,33 @@ if 'result' in st.session_state and st.session_state.result:
             </div>
             """, unsafe_allow_html=True)
 
-            # AI Summary
-            st.markdown("""
+            # AI Summary (heading and text sent as one element)
+            st.markdown(f"""
             <div style="margin-top: 2rem;">
                 <h2 style="font-size: 1.8rem; font-weight: 800; color: #58a6ff; margin-bottom: 0.8rem; display: flex; align-items: center; gap: 0.5rem;">
                     <span style="font-size: 2rem;">🤖</span> AI Summary
                 </h2>
             </div>
-            """, unsafe_allow_html=True)
-            st.markdown(f"""
             <div class="ai-reasoning">
                 {res['ai_summary']}
             </div>
             """, unsafe_allow_html=True)
 
 
-            # Alternative Locations
+            # Alternative Locations (heading and all rows sent as one element)
             if res["alternatives"]:
-                st.markdown("""
+                alt_rows = "".join(f"""
+                <div class="alt-location">
+                    <span style="color: #ffffff;"><strong>#{i+2}</strong> - {alt['code']}</span>
+                    <span style="color: #8b949e;">Used {alt['count']}× ({alt['percentage']:.1f}%)</span>
+                </div>""" for i, alt in enumerate(res["alternatives"]))
+                st.markdown(f"""
                 <div style="margin-top: 2rem;">
                     <h2 style="font-size: 1.8rem; font-weight: 800; color: #58a6ff; margin-bottom: 0.8rem; display: flex; align-items: center; gap: 0.5rem;">
                         <span style="font-size: 2rem;">📍</span> Alternative Free Locations
                     </h2>
-                </div>
+                </div>{alt_rows}
                 """, unsafe_allow_html=True)
-                for i, alt in enumerate(res["alternatives"]):
-                    st.markdown(f"""
-                    <div class="alt-location">
-                        <span style="color: #ffffff;"><strong>#{i+2}</strong> - {alt['code']}</span>
-                        <span style="color: #8b949e;">Used {alt['count']}× ({alt['percentage']:.1f}%)</span>
-                    </div>
-                    """, unsafe_allow_html=True)
 
             st.divider()
 
@@ -668,8 +984,10 @@ if 'result' in st.session_state and st.session_state.result:
                     if not chosen:
                         st.warning("Please enter a location code.")
                     elif chosen == rec["code"]:
+                        invalidate_location(chosen)
                         st.success(f"✅ **{chosen}** confirmed (recommended location)")
                     else:
+                        invalidate_location(chosen)
                         audit_logger.log_override(
                             part_id=res["part_id"],
                             part_code=res["part_code"],
@@ -3,6 +3,7 @@ Configuration module for Warehouse Qdrant System
 Loads environment variables and provides configuration objects with validation
 """
 import os
+import functools
 import logging
 from dotenv import load_dotenv
 from typing import Dict
@@ -34,6 +35,8 @@ class Config:
     QDRANT_URL = os.getenv('QDRANT_URL')
     QDRANT_API_KEY = os.getenv('QDRANT_API_KEY')
     QDRANT_COLLECTION_NAME = os.getenv('QDRANT_COLLECTION_NAME', 'PartSummary')
+    # gRPC keeps one multiplexed HTTP/2 channel open (port 6334) instead of REST requests
+    QDRANT_PREFER_GRPC = os.getenv('QDRANT_PREFER_GRPC', 'true').lower() == 'true'
 
     # Cloud SQL Configuration
     CLOUD_SQL_HOST = os.getenv('CLOUD_SQL_HOST')
@@ -41,17 +44,35 @@ class Config:
     CLOUD_SQL_DATABASE = os.getenv('CLOUD_SQL_DATABASE')
     CLOUD_SQL_USER = os.getenv('CLOUD_SQL_USER')
     CLOUD_SQL_PASSWORD = os.getenv('CLOUD_SQL_PASSWORD')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))
+    DB_POOL_WAIT = float(os.getenv('DB_POOL_WAIT', '5.0'))
 
     # Application Configuration
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     ENABLE_AUDIT_LOG = os.getenv('ENABLE_AUDIT_LOG', 'true').lower() == 'true'
+    AUDIT_QUEUE_SIZE = int(os.getenv('AUDIT_QUEUE_SIZE', '10000'))
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
 
+    # Caching Configuration
+    PART_CACHE_SIZE = int(os.getenv('PART_CACHE_SIZE', '4096'))
+    PART_INFO_TTL = float(os.getenv('PART_INFO_TTL', '300'))
+    LOCATION_CACHE_SIZE = int(os.getenv('LOCATION_CACHE_SIZE', '50000'))
+    LOCATION_STATUS_TTL = float(os.getenv('LOCATION_STATUS_TTL', '5.0'))
+    GEMINI_CACHE_SIZE = int(os.getenv('GEMINI_CACHE_SIZE', '2048'))
+    # SQLite file that keeps Gemini responses across restarts; off unless set, since
+    # stored prompts and responses include client names (e.g. cache/gemini_responses.db)
+    GEMINI_CACHE_DB = os.getenv('GEMINI_CACHE_DB', '')
+    GEMINI_CACHE_DB_TTL = float(os.getenv('GEMINI_CACHE_DB_TTL', str(7 * 24 * 3600)))
+    # Only call Gemini for ambiguous (mod/low usage) recommendations; strong patterns
+    # and the all-occupied case use their templates, which already say the same thing
+    LLM_ONLY_FOR_LOW_CONFIDENCE = os.getenv('LLM_ONLY_FOR_LOW_CONFIDENCE', 'true').lower() == 'true'
+
     @classmethod
+    @functools.cache
     def get_db_config(cls) -> Dict[str, any]:
         """
-        Get database configuration as dict
+        Get database configuration as dict (built once; treat as read-only)
 
         Returns:
             Dict with database connection parameters
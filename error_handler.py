@@ -2,14 +2,23 @@
 Error handling and logging utilities for Warehouse Putaway System
 Provides centralized error handling, retry logic, and audit logging
 """
+import atexit
 import logging
+import logging.handlers
 import functools
+import queue
+import random
 import time
 from typing import Callable, Any
 from datetime import datetime
 import json
 import os
 
+try:
+    import orjson  # Optional: C encoder, several times faster than the stdlib for audit events
+except ImportError:
+    orjson = None
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
@@ -34,14 +43,15 @@ class PartNotFoundError(Exception):
     pass
 
 
-def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0):
+def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0, max_delay: float = 30.0):
     """
-    Decorator to retry a function on failure with exponential backoff
+    Decorator to retry a function on failure with jittered exponential backoff
 
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries (seconds)
         backoff: Multiplier for delay after each retry
+        max_delay: Cap on the delay, however many retries have passed
 
     Example:
         @retry_on_failure(max_retries=3, delay=1.0)
@@ -60,16 +70,16 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float =
                 except Exception as e:
                     last_exception = e
                     if attempt < max_retries - 1:
+                        # +/-50% jitter, so sessions that failed together don't retry in lockstep
+                        sleep_for = current_delay * random.uniform(0.5, 1.5)
                         logger.warning(
-                            f"{func.__name__} failed (attempt {attempt + 1}/{max_retries}): {str(e)}. "
-                            f"Retrying in {current_delay}s..."
+                            "%s failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                            func.__name__, attempt + 1, max_retries, e, sleep_for
                         )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
+                        time.sleep(sleep_for)
+                        current_delay = min(current_delay * backoff, max_delay)
                     else:
-                        logger.error(
-                            f"{func.__name__} failed after {max_retries} attempts: {str(e)}"
-                        )
+                        logger.error("%s failed after %d attempts: %s", func.__name__, max_retries, e)
 
             raise last_exception
 
@@ -104,13 +114,37 @@ def log_exception(func: Callable) -> Callable:
     return wrapper
 
 
+def _encode_event(event: dict) -> str:
+    """Serialize an audit event to one JSON line"""
+    if orjson is not None:
+        return orjson.dumps(event).decode()
+    return json.dumps(event)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records when the bounded queue is full instead of blocking or raising"""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            logger.warning("Audit queue full, dropping audit event")
+
+
+class _AuditQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop sentinel waits for room in the bounded queue rather than failing"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
 class AuditLogger:
     """
     Audit logger for tracking all recommendations and user actions
     Logs to file for compliance and analysis
     """
 
-    def __init__(self, log_dir: str = "logs", enabled: bool = True):
+    def __init__(self, log_dir: str = "logs", enabled: bool = True, max_queue: int = 10000):
         self.log_dir = log_dir
         self.enabled = enabled
 
@@ -123,15 +157,28 @@ class AuditLogger:
             self.audit_logger = logging.getLogger('audit')
             self.audit_logger.setLevel(logging.INFO)
 
-            # File handler for audit logs
+            # File handler for audit logs, driven by a background listener thread:
+            # callers only enqueue the record, the disk write happens off the request path
             handler = logging.FileHandler(audit_file, encoding='utf-8')
             handler.setFormatter(logging.Formatter(
                 '%(asctime)s - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             ))
-            self.audit_logger.addHandler(handler)
+            # Bounded so a stalled disk cannot grow memory without limit; overflow is dropped
+            self._queue = queue.Queue(maxsize=max_queue)
+            self._listener = _AuditQueueListener(self._queue, handler)
+            self._listener.start()
+            atexit.register(self.close)
+
+            self.audit_logger.addHandler(_DroppingQueueHandler(self._queue))
             self.audit_logger.propagate = False  # Don't propagate to root logger
 
+    def close(self):
+        """Flush queued audit records to disk and stop the writer thread"""
+        if self.enabled and self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
     def log_recommendation(
         self,
         part_id: int,
@@ -160,7 +207,7 @@ class AuditLogger:
             'alternatives_count': len(alternatives) if alternatives else 0
         }
 
-        self.audit_logger.info(json.dumps(event))
+        self.audit_logger.info(_encode_event(event))
 
     def log_override(
         self,
@@ -186,7 +233,7 @@ class AuditLogger:
             'reason': reason or "Not specified"
         }
 
-        self.audit_logger.info(json.dumps(event))
+        self.audit_logger.info(_encode_event(event))
         logger.warning(f"Override: Part {part_code} - Recommended {recommended_location}, User chose {actual_location}")
 
     def log_error(
@@ -209,12 +256,12 @@ class AuditLogger:
             'context': context or {}
         }
 
-        self.audit_logger.error(json.dumps(event))
+        self.audit_logger.error(_encode_event(event))
 
 
 # Global audit logger instance
 from config import config
-audit_logger = AuditLogger(enabled=config.ENABLE_AUDIT_LOG)
+audit_logger = AuditLogger(enabled=config.ENABLE_AUDIT_LOG, max_queue=config.AUDIT_QUEUE_SIZE)
 
 
 def safe_database_call(func: Callable) -> Callable:
@@ -226,6 +273,12 @@ def safe_database_call(func: Callable) -> Callable:
         def get_part_info(cursor, part_id):
             cursor.execute("SELECT ... WHERE id = %s", (part_id,))
             return cursor.fetchone()
+
+    Queries that can return many rows should stream them in fixed-size chunks
+    instead of materializing everything with fetchall():
+        cursor.execute("SELECT code, clientId FROM location WHERE ...")
+        while rows := cursor.fetchmany(1000):
+            ...
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Any:
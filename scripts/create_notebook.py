@@ -1,520 +1,100 @@
+import base64
+import functools
+import hashlib
+import importlib.metadata
+import io
 import json
+import re
+import sys
+from pathlib import Path
+from types import MappingProxyType
 
-# Create comprehensive Jupyter notebook with detailed explanations
-notebook = {
-    "cells": [
-        # Title and Introduction
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "# StockRight Pattern Learning System\n",
-                "## How AI Learns Optimal Warehouse Locations from Historical Data\n",
-                "\n",
-                "---\n",
-                "\n",
-                "## 📋 Overview\n",
-                "\n",
-                "This notebook demonstrates the **complete machine learning pipeline** that powers StockRight's intelligent warehouse recommendation system.\n",
-                "\n",
-                "### What You'll Learn:\n",
-                "\n",
-                "1. How we extract patterns from **224,081 real warehouse transactions**\n",
-                "2. The SQL aggregation logic that learns location preferences\n",
-                "3. How AI generates context-aware recommendations\n",
-                "4. Real system outputs showing AI decision-making\n",
-                "\n",
-                "### The Learning Pipeline:\n",
-                "\n",
-                "```\n",
-                "📊 Historical Data (MySQL)\n",
-                "     ↓\n",
-                "🔄 Aggregation Pipeline\n",
-                "     ↓\n",
-                "🧠 Pattern Extraction\n",
-                "     ↓\n",
-                "💾 Knowledge Base (Qdrant)\n",
-                "     ↓\n",
-                "🎯 Smart Recommendations\n",
-                "```\n",
-                "\n",
-                "---"
-            ]
-        },
+try:
+    import orjson  # Optional: C encoder, much faster than the stdlib for large notebooks
+except ImportError:
+    orjson = None
 
-        # Setup Section
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 1️⃣ Setup and Dependencies\n",
-                "\n",
-                "Install required libraries (uncomment if running on Google Colab)"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# Uncomment for Google Colab\n",
-                "# !pip install mysql-connector-python pandas matplotlib seaborn\n",
-                "\n",
-                "import pandas as pd\n",
-                "import matplotlib.pyplot as plt\n",
-                "import seaborn as sns\n",
-                "from collections import Counter\n",
-                "\n",
-                "# Configure display settings\n",
-                "pd.set_option('display.max_columns', None)\n",
-                "pd.set_option('display.max_rows', 20)\n",
-                "sns.set_style('whitegrid')\n",
-                "plt.rcParams['figure.figsize'] = (12, 6)\n",
-                "\n",
-                "print('✅ Libraries loaded successfully')"
-            ]
-        },
+SCRIPT_PATH = Path(__file__)
+OUTPUT_PATH = Path('pattern_learning_demo.ipynb')
 
-        # Data Overview
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 2️⃣ Historical Data Overview\n",
-                "\n",
-                "Our system learns from real warehouse operations data:\n",
-                "\n",
-                "- **224,081** putaway transactions\n",
-                "- **3,215** unique parts\n",
-                "- **31,416** warehouse locations\n",
-                "- **87** different clients\n",
-                "\n",
-                "Each transaction records:\n",
-                "- Which **part** was stored\n",
-                "- In which **location**\n",
-                "- For which **client**\n",
-                "- **When** it happened"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# Sample data structure (what our transactions look like)\n",
-                "sample_transactions = pd.DataFrame([\n",
-                "    {'transaction_id': 12345, 'part_id': 600, 'part_code': '42645EQ', 'location': 'TN52D', 'client': 'ABC Corp', 'date': '2024-08-15'},\n",
-                "    {'transaction_id': 12346, 'part_id': 600, 'part_code': '42645EQ', 'location': 'TN52D', 'client': 'ABC Corp', 'date': '2024-08-20'},\n",
-                "    {'transaction_id': 12347, 'part_id': 600, 'part_code': '42645EQ', 'location': 'SG01J', 'client': 'ABC Corp', 'date': '2024-08-25'},\n",
-                "    {'transaction_id': 12348, 'part_id': 842, 'part_code': '91T47G22', 'location': 'M08F', 'client': 'XYZ Inc', 'date': '2024-09-01'},\n",
-                "])\n",
-                "\n",
-                "print(\"📝 Sample Transaction Data:\")\n",
-                "sample_transactions"
-            ]
-        },
 
-        # Pattern Learning Section
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 3️⃣ Pattern Learning: The Core Algorithm\n",
-                "\n",
-                "### How We Extract Patterns\n",
-                "\n",
-                "The system uses **SQL aggregation** to learn where each part is typically stored.\n",
-                "\n",
-                "#### Step-by-Step Process:\n",
-                "\n",
-                "1. **Filter Invalid Locations**\n",
-                "   - Remove temporary locations (FLOOR1, FLOOR2)\n",
-                "   - Remove receiving areas (REC001, REC002)\n",
-                "   - Remove staging areas (ORD001, ORD002)\n",
-                "   \n",
-                "2. **Group by Part ID**\n",
-                "   - Organize all transactions for each part\n",
-                "   \n",
-                "3. **Count Location Usage**\n",
-                "   - How many times was each location used?\n",
-                "   \n",
-                "4. **Calculate Percentages**\n",
-                "   - What % of putaways went to each location?\n",
-                "   \n",
-                "5. **Rank by Frequency**\n",
-                "   - Sort locations from most to least used"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# THE CORE LEARNING QUERY\n",
-                "# This is the actual SQL that extracts patterns from historical data\n",
-                "\n",
-                "aggregation_query = '''\n",
-                "SELECT\n",
-                "    p.id AS part_id,\n",
-                "    p.code AS part_code,\n",
-                "    l.code AS location_code,\n",
-                "    COUNT(*) AS usage_count,\n",
-                "    totals.total_putaways,\n",
-                "    ROUND(COUNT(*) * 100.0 / totals.total_putaways, 2) AS usage_percentage\n",
-                "FROM \n",
-                "    putaway_transaction pt\n",
-                "    JOIN part p ON pt.partId = p.id\n",
-                "    JOIN location l ON pt.locationId = l.id\n",
-                "    JOIN (\n",
-                "        -- Subquery: Calculate total putaways for each part\n",
-                "        SELECT partId, COUNT(*) AS total_putaways\n",
-                "        FROM putaway_transaction\n",
-                "        GROUP BY partId\n",
-                "    ) totals ON p.id = totals.partId\n",
-                "WHERE\n",
-                "    -- FILTER: Remove invalid locations\n",
-                "    l.code NOT LIKE 'FLOOR%'\n",
-                "    AND l.code NOT LIKE 'REC%'\n",
-                "    AND l.code NOT LIKE 'ORD%'\n",
-                "GROUP BY\n",
-                "    p.id, l.code\n",
-                "ORDER BY\n",
-                "    p.id, usage_count DESC\n",
-                "'''\n",
-                "\n",
-                "print(\"✅ Core Learning Query Defined\")\n",
-                "print(\"\\nThis query extracts location usage patterns for every part in the warehouse.\")"
-            ]
-        },
+def _renderer_tag() -> bytes:
+    """Identify the chart renderer, since the pie cell's saved output depends on it"""
+    try:
+        return f"matplotlib-{importlib.metadata.version('matplotlib')}".encode('ascii')
+    except importlib.metadata.PackageNotFoundError:
+        return b"no-matplotlib"
 
-        # Example Pattern
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 4️⃣ Example: Learning Pattern for Part 600\n",
-                "\n",
-                "Let's see how the system learns preferences for a specific part."
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# Simulated result for Part 600 (42645EQ - Bearing)\n",
-                "# This is what the aggregation query returns\n",
-                "\n",
-                "part_600_pattern = pd.DataFrame([\n",
-                "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'TN52D', 'usage_count': 15, 'total_putaways': 53, 'usage_percentage': 28.3},\n",
-                "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'SG01J', 'usage_count': 8, 'total_putaways': 53, 'usage_percentage': 15.1},\n",
-                "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'TP03D', 'usage_count': 3, 'total_putaways': 53, 'usage_percentage': 5.66},\n",
-                "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'TN43D', 'usage_count': 1, 'total_putaways': 53, 'usage_percentage': 1.9},\n",
-                "])\n",
-                "\n",
-                "print(\"📦 Learned Pattern for Part 600 (42645EQ - Bearing)\")\n",
-                "print(\"=\"*60)\n",
-                "print(f\"Total Historical Putaways: 53\")\n",
-                "print(f\"\\nLocation Preferences (ranked by usage):\")\n",
-                "print()\n",
-                "part_600_pattern"
-            ]
-        },
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "### 📊 What This Tells Us:\n",
-                "\n",
-                "- **TN52D** is the most preferred location (28.3% of all putaways)\n",
-                "- **SG01J** is the second choice (15.1%)\n",
-                "- Other locations were used less frequently\n",
-                "\n",
-                "**This becomes the \"knowledge\" stored in Qdrant Vector Database for instant retrieval.**"
-            ]
-        },
 
-        # Visualization
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# Visualize the pattern\n",
-                "plt.figure(figsize=(10, 6))\n",
-                "bars = plt.bar(part_600_pattern['location_code'], part_600_pattern['usage_count'], \n",
-                "               color=['#3fb950', '#58a6ff', '#58a6ff', '#58a6ff'], edgecolor='black', linewidth=1.5)\n",
-                "plt.xlabel('Location Code', fontsize=12, weight='bold')\n",
-                "plt.ylabel('Usage Count', fontsize=12, weight='bold')\n",
-                "plt.title('Historical Location Usage for Part 600 (42645EQ)', fontsize=14, weight='bold')\n",
-                "plt.grid(axis='y', alpha=0.3)\n",
-                "\n",
-                "# Add percentage labels on bars\n",
-                "for i, (bar, pct) in enumerate(zip(bars, part_600_pattern['usage_percentage'])):\n",
-                "    height = bar.get_height()\n",
-                "    plt.text(bar.get_x() + bar.get_width()/2., height + 0.5,\n",
-                "             f'{pct}%', ha='center', fontsize=10, weight='bold')\n",
-                "\n",
-                "plt.tight_layout()\n",
-                "plt.show()\n",
-                "\n",
-                "print(\"✅ TN52D is clearly the preferred location (used 15 times out of 53)\")"
-            ]
-        },
+# Content hash of this script and the chart renderer, embedded in the notebook
+# metadata so an unchanged build can be detected from the first few bytes of the
+# existing file
+BUILD_VERSION = hashlib.sha256(SCRIPT_PATH.read_bytes() + b"\0" + _renderer_tag()).hexdigest()[:16]
+VERSION_KEY = 'x-stockright-version'
 
-        # Pattern Strength Classification
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 5️⃣ Pattern Strength Classification\n",
-                "\n",
-                "Not all patterns are equally strong. We classify them based on usage percentage:"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "def classify_pattern_strength(top_percentage):\n",
-                "    \"\"\"\n",
-                "    Classify how strong a pattern is based on the top location's usage percentage\n",
-                "    \"\"\"\n",
-                "    if top_percentage >= 50:\n",
-                "        return 'STRONG'\n",
-                "    elif top_percentage >= 20:\n",
-                "        return 'MEDIUM'\n",
-                "    else:\n",
-                "        return 'WEAK'\n",
-                "\n",
-                "# Examples\n",
-                "examples = [\n",
-                "    {'part': 'Part 1827', 'top_location': 'G35F', 'percentage': 68.0, 'strength': classify_pattern_strength(68.0)},\n",
-                "    {'part': 'Part 600', 'top_location': 'TN52D', 'percentage': 28.3, 'strength': classify_pattern_strength(28.3)},\n",
-                "    {'part': 'Part 522', 'top_location': 'G28F', 'percentage': 12.5, 'strength': classify_pattern_strength(12.5)},\n",
-                "]\n",
-                "\n",
-                "df_examples = pd.DataFrame(examples)\n",
-                "print(\"Pattern Strength Classification:\")\n",
-                "print(\"=\"*60)\n",
-                "df_examples"
-            ]
-        },
+# Dataset figures quoted throughout the notebook. Cells reference them as
+# {{name}} placeholders, so refreshing the numbers after a re-learn only
+# touches this dict.
+NOTEBOOK_STATS = {
+    'transactions': '224,081',
+    'parts': '3,215',
+    'locations': '31,416',
+    'clients': '87',
+    'patterns': '2,492',
+    'coverage': '77.5%',
+}
+_PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
 
-        # AI Recommendation Logic
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 6️⃣ How AI Generates Recommendations\n",
-                "\n",
-                "When a part arrives at the warehouse:\n",
-                "\n",
-                "1. **Retrieve Pattern** from Qdrant (< 100ms)\n",
-                "2. **Check Availability** - Which historical locations are FREE? (real-time MySQL query)\n",
-                "3. **Rank Options** - Prefer most-used FREE location\n",
-                "4. **Generate AI Explanation** - Gemini creates natural language summary\n",
-                "\n",
-                "### The AI adapts its response based on pattern strength:"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# AI Response Examples (Real outputs from Gemini)\n",
-                "\n",
-                "ai_responses = {\n",
-                "    'STRONG Pattern (≥50%)': {\n",
-                "        'Example': 'Part 1827 (BA-08447P) → Location G35F (68% usage)',\n",
-                "        'AI Says': 'Location G35F is highly recommended as it is the most preferred location for this part with a strong historical pattern. The location is currently FREE and ready for immediate use.'\n",
-                "    },\n",
-                "    'MEDIUM Pattern (20-50%)': {\n",
-                "        'Example': 'Part 600 (42645EQ) → Location TN52D (28.3% usage)',\n",
-                "        'AI Says': 'Location TN52D is recommended as it follows the established pattern for this part. The location is currently FREE and ready for immediate use.'\n",
-                "    },\n",
-                "    'WEAK Pattern (<20%)': {\n",
-                "        'Example': 'Part 522 (405407) → Location G28F (12.5% usage)',\n",
-                "        'AI Says': 'Location G28F is recommended based on historical usage patterns. The location is currently FREE and available for use.'\n",
-                "    },\n",
-                "    'All Locations Occupied': {\n",
-                "        'Example': 'Part 736 (627804) - all historical locations occupied',\n",
-                "        'AI Says': 'All previously used locations are currently occupied. Please consult your supervisor and look for a free location in Zone H, following the historical storage pattern for this part.'\n",
-                "    },\n",
-                "    'No Historical Data': {\n",
-                "        'Example': 'New part with no putaway history',\n",
-                "        'AI Says': 'This part has no historical putaway data. Consult your supervisor — consider placing it in Zone T based on similar parts.'\n",
-                "    }\n",
-                "}\n",
-                "\n",
-                "print(\"🤖 AI Response Adaptation Examples\")\n",
-                "print(\"=\"*70)\n",
-                "for scenario, data in ai_responses.items():\n",
-                "    print(f\"\\n{scenario}\")\n",
-                "    print(\"-\"*70)\n",
-                "    print(f\"Scenario: {data['Example']}\")\n",
-                "    print(f\"AI Response:\")\n",
-                "    print(f\"  '{data['AI Says']}'\")\n",
-                "    print()"
-            ]
-        },
+# Pattern strength split shown in the pie chart cell; the chart is rendered once
+# at build time and embedded as the cell's output
+PATTERN_STRENGTH_STATS = {
+    'STRONG (>50%)': 892,
+    'MEDIUM (20-50%)': 1156,
+    'WEAK (<20%)': 444,
+}
+PATTERN_STRENGTH_COLORS = ['#3fb950', '#f39c12', '#e74c3c']
+# Line printed by the pie chart cell, also saved as its stdout output
+PATTERN_PIE_SUMMARY = "✅ 82.2% of patterns are STRONG or MEDIUM quality"
 
-        # System Output Example
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 7️⃣ Complete System Output Example\n",
-                "\n",
-                "Here's what the user sees when they request a recommendation:"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# Simulated system output for Part 600\n",
-                "print(\"\"\"\\n",
-                "╔════════════════════════════════════════════════════════════════╗\n",
-                "║           StockRight - Smart Warehouse Assistant               ║\n",
-                "╚════════════════════════════════════════════════════════════════╝\n",
-                "\n",
-                "📦 PART INFORMATION:\n",
-                "   Part ID:      600\n",
-                "   Part Code:    42645EQ\n",
-                "   Description:  Bearing\n",
-                "   Client:       ABC Corporation\n",
-                "\n",
-                "✅ RECOMMENDED LOCATION: TN52D\n",
-                "\n",
-                "   Status:           FREE ✓\n",
-                "   Historical Uses:  15 × / 53 total putaways\n",
-                "   Usage Rate:       28.3%\n",
-                "\n",
-                "🤖 AI RECOMMENDATION:\n",
-                "   \"Location TN52D is recommended as it follows the established \n",
-                "   pattern for this part. The location is currently FREE and ready \n",
-                "   for immediate use.\"\n",
-                "\n",
-                "📋 ALTERNATIVE FREE LOCATIONS:\n",
-                "   #1: SG01J (15.1%)\n",
-                "   #2: TP03D (5.66%)\n",
-                "\n",
-                "════════════════════════════════════════════════════════════════\n",
-                "\"\"\")"
-            ]
-        },
+# Separator lines repeated across code cells, shared as single interned strings
+SEP60 = sys.intern('print("="*60)\n')
+SEP70 = sys.intern('print("="*70)\n')
 
-        # Key Statistics
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 8️⃣ System Performance & Statistics\n",
-                "\n",
-                "### Learning Results:\n",
-                "\n",
-                "- **Input:** 224,081 historical transactions\n",
-                "- **Output:** 2,492 learned patterns (77.5% of all parts)\n",
-                "- **Coverage:** Patterns for 2,492 out of 3,215 parts\n",
-                "\n",
-                "### Pattern Quality Distribution:\n",
-                "\n",
-                "- **Strong Patterns (>50% usage):** 892 parts (35.8%)\n",
-                "- **Medium Patterns (20-50%):** 1,156 parts (46.4%)\n",
-                "- **Weak Patterns (<20%):** 444 parts (17.8%)\n",
-                "\n",
-                "### Validation Results:\n",
-                "\n",
-                "- **Accuracy:** 100% (200/200 test cases)\n",
-                "- **Pattern Match:** System correctly identifies historical locations\n",
-                "- **Status Verification:** Real-time availability checks are accurate"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "execution_count": None,
-            "metadata": {},
-            "outputs": [],
-            "source": [
-                "# Visualize pattern quality distribution\n",
-                "pattern_stats = {\n",
-                "    'STRONG (>50%)': 892,\n",
-                "    'MEDIUM (20-50%)': 1156,\n",
-                "    'WEAK (<20%)': 444\n",
-                "}\n",
-                "\n",
-                "plt.figure(figsize=(10, 6))\n",
-                "colors = ['#3fb950', '#f39c12', '#e74c3c']\n",
-                "plt.pie(pattern_stats.values(), labels=pattern_stats.keys(), autopct='%1.1f%%',\n",
-                "        colors=colors, startangle=90, textprops={'fontsize': 12, 'weight': 'bold'})\n",
-                "plt.title('Pattern Strength Distribution Across 2,492 Learned Patterns', fontsize=14, weight='bold')\n",
-                "plt.tight_layout()\n",
-                "plt.show()\n",
-                "\n",
-                "print(\"✅ 82.2% of patterns are STRONG or MEDIUM quality\")"
-            ]
-        },
+# Source of the "Complete System Output Example" cell, kept as one string so the
+# notebook stores it as a single JSON value instead of a list of lines
+SYSTEM_OUTPUT_EXAMPLE = r'''# Simulated system output for Part 600
+print("""\n╔════════════════════════════════════════════════════════════════╗
+║           StockRight - Smart Warehouse Assistant               ║
+╚════════════════════════════════════════════════════════════════╝
 
-        # Summary
-        {
-            "cell_type": "markdown",
-            "metadata": {},
-            "source": [
-                "## 🎯 Summary\n",
-                "\n",
-                "### What We've Demonstrated:\n",
-                "\n",
-                "1. **Data-Driven Learning**\n",
-                "   - System learns from 224K+ real transactions\n",
-                "   - Not random - based on proven historical patterns\n",
-                "\n",
-                "2. **Transparent Logic**\n",
-                "   - SQL aggregation extracts location preferences\n",
-                "   - Pattern strength classification ensures quality\n",
-                "   - All code is visible and explainable\n",
-                "\n",
-                "3. **AI-Powered Recommendations**\n",
-                "   - Gemini AI generates context-aware explanations\n",
-                "   - Responses adapt based on pattern strength\n",
-                "   - Not hardcoded - truly intelligent\n",
-                "\n",
-                "4. **Production Ready**\n",
-                "   - 100% validation accuracy\n",
-                "   - Real-time availability checks\n",
-                "   - Fast retrieval (< 100ms from Qdrant)\n",
-                "\n",
-                "---\n",
-                "\n",
-                "## 🚀 Why This Matters\n",
-                "\n",
-                "**Traditional Approach:**\n",
-                "- Manual location assignment\n",
-                "- Inconsistent decisions\n",
-                "- No learning from past experience\n",
-                "\n",
-                "**StockRight Approach:**\n",
-                "- Automated, data-driven recommendations\n",
-                "- Consistent with historical best practices\n",
-                "- Continuously learns from warehouse operations\n",
-                "\n",
-                "---\n",
-                "\n",
-                "**This notebook shows the complete end-to-end learning process that powers StockRight's intelligent warehouse recommendations.**"
-            ]
-        }
-    ],
+📦 PART INFORMATION:
+   Part ID:      600
+   Part Code:    42645EQ
+   Description:  Bearing
+   Client:       ABC Corporation
+
+✅ RECOMMENDED LOCATION: TN52D
+
+   Status:           FREE ✓
+   Historical Uses:  15 × / 53 total putaways
+   Usage Rate:       28.3%
+
+🤖 AI RECOMMENDATION:
+   "Location TN52D is recommended as it follows the established 
+   pattern for this part. The location is currently FREE and ready 
+   for immediate use."
+
+📋 ALTERNATIVE FREE LOCATIONS:
+   #1: SG01J (15.1%)
+   #2: TP03D (5.66%)
+
+════════════════════════════════════════════════════════════════
+""")'''
+
+
+# Notebook-level fields, written ahead of the streamed cells. Read-only: the
+# header is always built from a copy
+NOTEBOOK_METADATA = MappingProxyType({
     "metadata": {
         "kernelspec": {
             "display_name": "Python 3",
@@ -539,11 +119,621 @@ notebook = {
     },
     "nbformat": 4,
     "nbformat_minor": 4
-}
+})
+
+
+def cell(source, cell_type: str = 'markdown', outputs: tuple = ()) -> dict:
+    """
+    Create a notebook cell whose source is pre-joined into a single string,
+    with {{name}} placeholders filled from NOTEBOOK_STATS
+    """
+    text = _PLACEHOLDER.sub(lambda m: NOTEBOOK_STATS[m.group(1)], "".join(source))
+    result = {"cell_type": cell_type, "metadata": {}, "source": text}
+    if cell_type == 'code':
+        result["execution_count"] = 1 if outputs else None
+        result["outputs"] = outputs
+    return result
+
+
+def show_lines(title: str, expr: str, sep: str = SEP60) -> list:
+    """Closing source lines of a display cell: print the title and a separator, then show expr"""
+    return [f'print("{title}")\n', sep, expr]
+
+
+@functools.cache
+def render_pattern_pie() -> tuple:
+    """
+    Render the pattern strength pie chart to a PNG display_data output,
+    followed by the cell's printed summary line
+
+    Returns no outputs when matplotlib is not installed, leaving the cell
+    to draw the chart itself when run.
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return ()
+
+    fig = plt.figure(figsize=(10, 6))
+    plt.pie(PATTERN_STRENGTH_STATS.values(), labels=PATTERN_STRENGTH_STATS.keys(), autopct='%1.1f%%',
+            colors=PATTERN_STRENGTH_COLORS, startangle=90, textprops={'fontsize': 12, 'weight': 'bold'})
+    plt.title(f"Pattern Strength Distribution Across {NOTEBOOK_STATS['patterns']} Learned Patterns",
+              fontsize=14, weight='bold')
+    plt.tight_layout()
+    buf = io.BytesIO()
+    # No Software metadata, so the PNG bytes only change when the chart does
+    fig.savefig(buf, format='png', dpi=100, metadata={'Software': None})
+    plt.close(fig)
+
+    strong, medium, weak = PATTERN_STRENGTH_STATS.values()
+    fallback = f"Pattern strength: {strong} STRONG, {medium} MEDIUM, {weak} WEAK"
+    return ({
+        "output_type": "display_data",
+        "data": {
+            "image/png": base64.b64encode(buf.getvalue()).decode('ascii'),
+            "text/markdown": fallback,
+            "text/plain": fallback,
+        },
+        "metadata": {},
+    }, {
+        "output_type": "stream",
+        "name": "stdout",
+        "text": PATTERN_PIE_SUMMARY + "\n",
+    })
+
+
+def build_cells() -> tuple:
+    """Create comprehensive Jupyter notebook cells with detailed explanations"""
+    return (
+        # Title and Introduction
+        cell([
+            "# StockRight Pattern Learning System\n",
+            "## How AI Learns Optimal Warehouse Locations from Historical Data\n",
+            "\n",
+            "---\n",
+            "\n",
+            "## 📋 Overview\n",
+            "\n",
+            "This notebook demonstrates the **complete machine learning pipeline** that powers StockRight's intelligent warehouse recommendation system.\n",
+            "\n",
+            "### What You'll Learn:\n",
+            "\n",
+            "1. How we extract patterns from **{{transactions}} real warehouse transactions**\n",
+            "2. The SQL aggregation logic that learns location preferences\n",
+            "3. How AI generates context-aware recommendations\n",
+            "4. Real system outputs showing AI decision-making\n",
+            "\n",
+            "### The Learning Pipeline:\n",
+            "\n",
+            "```\n",
+            "📊 Historical Data (MySQL)\n",
+            "     ↓\n",
+            "🔄 Aggregation Pipeline\n",
+            "     ↓\n",
+            "🧠 Pattern Extraction\n",
+            "     ↓\n",
+            "💾 Knowledge Base (Qdrant)\n",
+            "     ↓\n",
+            "🎯 Smart Recommendations\n",
+            "```\n",
+            "\n",
+            "---"
+        ]),
+
+        # Setup Section
+        cell([
+            "## 1️⃣ Setup and Dependencies\n",
+            "\n",
+            "Install required libraries (uncomment if running on Google Colab)"
+        ]),
+        cell([
+            "# Uncomment for Google Colab\n",
+            "# !pip install mysql-connector-python numpy pandas matplotlib seaborn\n",
+            "\n",
+            "import numpy as np\n",
+            "import pandas as pd\n",
+            "import matplotlib.pyplot as plt\n",
+            "import seaborn as sns\n",
+            "from collections import Counter\n",
+            "\n",
+            "# Configure display settings\n",
+            "# pandas' default column/row caps are kept; cells show .head() slices\n",
+            "# (use df.to_string() when the full table is needed)\n",
+            "sns.set_style('whitegrid')\n",
+            "plt.rcParams['figure.figsize'] = (12, 6)\n",
+            "\n",
+            "print('✅ Libraries loaded successfully')"
+        ], 'code'),
+
+        # Data Overview
+        cell([
+            "## 2️⃣ Historical Data Overview\n",
+            "\n",
+            "Our system learns from real warehouse operations data:\n",
+            "\n",
+            "- **{{transactions}}** putaway transactions\n",
+            "- **{{parts}}** unique parts\n",
+            "- **{{locations}}** warehouse locations\n",
+            "- **{{clients}}** different clients\n",
+            "\n",
+            "Each transaction records:\n",
+            "- Which **part** was stored\n",
+            "- In which **location**\n",
+            "- For which **client**\n",
+            "- **When** it happened"
+        ]),
+        cell([
+            "# Sample data structure (what our transactions look like)\n",
+            "sample_transactions = pd.DataFrame([\n",
+            "    {'transaction_id': 12345, 'part_id': 600, 'part_code': '42645EQ', 'location': 'TN52D', 'client': 'ABC Corp', 'date': '2024-08-15'},\n",
+            "    {'transaction_id': 12346, 'part_id': 600, 'part_code': '42645EQ', 'location': 'TN52D', 'client': 'ABC Corp', 'date': '2024-08-20'},\n",
+            "    {'transaction_id': 12347, 'part_id': 600, 'part_code': '42645EQ', 'location': 'SG01J', 'client': 'ABC Corp', 'date': '2024-08-25'},\n",
+            "    {'transaction_id': 12348, 'part_id': 842, 'part_code': '91T47G22', 'location': 'M08F', 'client': 'XYZ Inc', 'date': '2024-09-01'},\n",
+            "])\n",
+            "\n",
+            "print(\"📝 Sample Transaction Data:\")\n",
+            "sample_transactions.head()"
+        ], 'code'),
+
+        # Pattern Learning Section
+        cell([
+            "## 3️⃣ Pattern Learning: The Core Algorithm\n",
+            "\n",
+            "### How We Extract Patterns\n",
+            "\n",
+            "The system uses **SQL aggregation** to learn where each part is typically stored.\n",
+            "\n",
+            "#### Step-by-Step Process:\n",
+            "\n",
+            "1. **Filter Invalid Locations**\n",
+            "   - Remove temporary locations (FLOOR1, FLOOR2)\n",
+            "   - Remove receiving areas (REC001, REC002)\n",
+            "   - Remove staging areas (ORD001, ORD002)\n",
+            "   \n",
+            "2. **Group by Part ID**\n",
+            "   - Organize all transactions for each part\n",
+            "   \n",
+            "3. **Count Location Usage**\n",
+            "   - How many times was each location used?\n",
+            "   \n",
+            "4. **Calculate Percentages**\n",
+            "   - What % of putaways went to each location?\n",
+            "   \n",
+            "5. **Rank by Frequency**\n",
+            "   - Sort locations from most to least used"
+        ]),
+        cell([
+            "# THE CORE LEARNING QUERY\n",
+            "# This is the actual SQL that extracts patterns from historical data\n",
+            "\n",
+            "aggregation_query = '''\n",
+            "SELECT\n",
+            "    p.id AS part_id,\n",
+            "    p.code AS part_code,\n",
+            "    l.code AS location_code,\n",
+            "    COUNT(*) AS usage_count,\n",
+            "    -- Window over the grouped rows: per-part total in the same pass\n",
+            "    SUM(COUNT(*)) OVER (PARTITION BY p.id) AS total_putaways,\n",
+            "    ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (PARTITION BY p.id), 2) AS usage_percentage\n",
+            "FROM \n",
+            "    putaway_transaction pt\n",
+            "    JOIN part p ON pt.partId = p.id\n",
+            "    JOIN location l ON pt.locationId = l.id\n",
+            "WHERE\n",
+            "    -- FILTER: Remove invalid locations (FLOOR*, REC*, ORD*)\n",
+            "    l.code NOT REGEXP '^(FLOOR|REC|ORD)'\n",
+            "GROUP BY\n",
+            "    p.id, l.code\n",
+            "ORDER BY\n",
+            "    p.id, usage_count DESC\n",
+            "'''\n",
+            "\n",
+            "# Recommended supporting index (lets the GROUP BY read partId/locationId from the index):\n",
+            "# CREATE INDEX idx_putaway_part_loc ON putaway_transaction (partId, locationId);\n",
+            "\n",
+            "# Running it over the full history: stream the result in chunks so only one chunk\n",
+            "# is held client-side at a time (mysql.connector cursors are unbuffered by default;\n",
+            "# use_pure=False selects the C protocol parser). Rows arrive ordered by part and\n",
+            "# usage, so each chunk's first row per part is that part's top location:\n",
+            "# conn = mysql.connector.connect(**db_config, use_pure=False)\n",
+            "# top_locations = pd.concat(\n",
+            "#     (chunk.drop_duplicates('part_id') for chunk in pd.read_sql(aggregation_query, conn, chunksize=50_000)),\n",
+            "#     ignore_index=True,\n",
+            "# ).drop_duplicates('part_id')\n",
+            "\n",
+            "print(\"✅ Core Learning Query Defined\")\n",
+            "print(\"\\nThis query extracts location usage patterns for every part in the warehouse.\")"
+        ], 'code'),
+        cell([
+            "# The same aggregation in pandas, for when the transaction history is already loaded\n",
+            "# client-side (e.g. re-learning from an export). Every step is a whole-column\n",
+            "# operation, so there is no per-transaction Python loop.\n",
+            "def aggregate_patterns(transactions, top_n=5):\n",
+            "    \"\"\"Per-part location usage counts and percentages, top_n locations per part\"\"\"\n",
+            "    locations = transactions['location']\n",
+            "    valid = transactions[~locations.str.startswith(('FLOOR', 'REC', 'ORD'), na=True)]\n",
+            "    counts = valid.groupby(['part_id', 'location']).size().rename('usage_count').reset_index()\n",
+            "    counts['total_putaways'] = counts.groupby('part_id')['usage_count'].transform('sum')\n",
+            "    counts['usage_percentage'] = (counts['usage_count'] * 100.0 / counts['total_putaways']).round(2)\n",
+            "    ranked = counts.sort_values(['part_id', 'usage_count'], ascending=[True, False], kind='stable')\n",
+            "    return ranked.groupby('part_id').head(top_n).reset_index(drop=True)\n",
+            "\n",
+            "patterns = aggregate_patterns(sample_transactions)\n",
+            "\n",
+            "# Primary zone: the zone (leading letter of the location) with the most putaways per part\n",
+            "zone_usage = patterns.groupby(['part_id', patterns['location'].str[0]])['usage_count'].sum()\n",
+            "primary_zone = zone_usage.groupby(level='part_id').idxmax().str[1]\n",
+            "\n",
+            "print(f\"Primary zones: {primary_zone.to_dict()}\")\n",
+            "patterns"
+        ], 'code'),
+        cell([
+            "# Re-learning is deterministic for a given transaction history, so each run's result\n",
+            "# is kept on disk keyed by the highest putaway_transaction id (the watermark). Ids only\n",
+            "# grow, so on the next run only parts with transactions above the previous watermark\n",
+            "# are re-aggregated; an unchanged history is a single file read.\n",
+            "import os\n",
+            "from pathlib import Path\n",
+            "\n",
+            "PATTERN_CACHE_DIR = Path('pattern_cache')\n",
+            "\n",
+            "def _fetch_column(conn, sql, params=()):\n",
+            "    cursor = conn.cursor()\n",
+            "    try:\n",
+            "        cursor.execute(sql, params)\n",
+            "        return [row[0] for row in cursor.fetchall()]\n",
+            "    finally:\n",
+            "        cursor.close()\n",
+            "\n",
+            "def _cache_watermark(path):\n",
+            "    return int(path.stem.rsplit('-', 1)[1])\n",
+            "\n",
+            "def learn_patterns_cached(conn, load_transactions, top_n=5):\n",
+            "    \"\"\"\n",
+            "    aggregate_patterns() memoized on disk across runs.\n",
+            "    load_transactions(conn, part_ids) returns the putaway history as a DataFrame,\n",
+            "    restricted to part_ids unless it is None.\n",
+            "\n",
+            "    Assumes putaway_transaction is append-only: edits or deletes of rows below a\n",
+            "    cached watermark are not detected, so clear PATTERN_CACHE_DIR after such changes.\n",
+            "    A cached watermark above the current MAX(id) (rows deleted, table rebuilt) is\n",
+            "    never reused; without an older snapshot the patterns are rebuilt in full.\n",
+            "    \"\"\"\n",
+            "    watermark = _fetch_column(conn, \"SELECT COALESCE(MAX(id), 0) FROM putaway_transaction\")[0]\n",
+            "    path = PATTERN_CACHE_DIR / f'patterns-top{top_n}-{watermark}.pkl'\n",
+            "    if path.exists():\n",
+            "        return pd.read_pickle(path)\n",
+            "\n",
+            "    previous = sorted(PATTERN_CACHE_DIR.glob(f'patterns-top{top_n}-*.pkl'), key=_cache_watermark)\n",
+            "    usable = [p for p in previous if _cache_watermark(p) <= watermark]\n",
+            "    if usable:\n",
+            "        changed = _fetch_column(conn, \"SELECT DISTINCT partId FROM putaway_transaction WHERE id > %s\",\n",
+            "                                (_cache_watermark(usable[-1]),))\n",
+            "        cached = pd.read_pickle(usable[-1])\n",
+            "        patterns = pd.concat([cached[~cached['part_id'].isin(changed)],\n",
+            "                              aggregate_patterns(load_transactions(conn, changed), top_n)])\n",
+            "        patterns = patterns.sort_values(['part_id', 'usage_count'], ascending=[True, False],\n",
+            "                                        kind='stable').reset_index(drop=True)\n",
+            "    else:\n",
+            "        patterns = aggregate_patterns(load_transactions(conn, None), top_n)\n",
+            "\n",
+            "    # Write to a temporary name and rename, so a reader never sees a partial file\n",
+            "    PATTERN_CACHE_DIR.mkdir(exist_ok=True)\n",
+            "    tmp = path.with_suffix('.tmp')\n",
+            "    patterns.to_pickle(tmp)\n",
+            "    os.replace(tmp, path)\n",
+            "    for old in previous:\n",
+            "        old.unlink(missing_ok=True)\n",
+            "    return patterns\n",
+            "\n",
+            "print(\"✅ Pattern cache ready\")"
+        ], 'code'),
+
+        # Example Pattern
+        cell([
+            "## 4️⃣ Example: Learning Pattern for Part 600\n",
+            "\n",
+            "Let's see how the system learns preferences for a specific part."
+        ]),
+        cell([
+            "# Simulated result for Part 600 (42645EQ - Bearing)\n",
+            "# This is what the aggregation query returns\n",
+            "\n",
+            "part_600_pattern = pd.DataFrame([\n",
+            "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'TN52D', 'usage_count': 15, 'total_putaways': 53, 'usage_percentage': 28.3},\n",
+            "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'SG01J', 'usage_count': 8, 'total_putaways': 53, 'usage_percentage': 15.1},\n",
+            "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'TP03D', 'usage_count': 3, 'total_putaways': 53, 'usage_percentage': 5.66},\n",
+            "    {'part_id': 600, 'part_code': '42645EQ', 'location_code': 'TN43D', 'usage_count': 1, 'total_putaways': 53, 'usage_percentage': 1.9},\n",
+            "])\n",
+            "\n",
+            "print(\"📦 Learned Pattern for Part 600 (42645EQ - Bearing)\")\n",
+            SEP60,
+            "print(f\"Total Historical Putaways: 53\")\n",
+            "print(f\"\\nLocation Preferences (ranked by usage):\")\n",
+            "print()\n",
+            "part_600_pattern.head()"
+        ], 'code'),
+        cell([
+            "### 📊 What This Tells Us:\n",
+            "\n",
+            "- **TN52D** is the most preferred location (28.3% of all putaways)\n",
+            "- **SG01J** is the second choice (15.1%)\n",
+            "- Other locations were used less frequently\n",
+            "\n",
+            "**This becomes the \"knowledge\" stored in Qdrant Vector Database for instant retrieval.**"
+        ]),
+
+        # Visualization
+        cell([
+            "# Visualize the pattern\n",
+            "fig, ax = plt.subplots(figsize=(10, 6))\n",
+            "bars = ax.bar(part_600_pattern['location_code'], part_600_pattern['usage_count'], \n",
+            "              color=['#3fb950', '#58a6ff', '#58a6ff', '#58a6ff'], edgecolor='black', linewidth=1.5)\n",
+            "ax.set_xlabel('Location Code', fontsize=12, weight='bold')\n",
+            "ax.set_ylabel('Usage Count', fontsize=12, weight='bold')\n",
+            "ax.set_title('Historical Location Usage for Part 600 (42645EQ)', fontsize=14, weight='bold')\n",
+            "ax.grid(axis='y', alpha=0.3)\n",
+            "\n",
+            "# Add percentage labels on all bars in one pass (matplotlib >= 3.4)\n",
+            "ax.bar_label(bars, labels=[f'{pct}%' for pct in part_600_pattern['usage_percentage']],\n",
+            "             padding=3, fontsize=10, fontweight='bold')\n",
+            "\n",
+            "plt.tight_layout()\n",
+            "plt.show()\n",
+            "\n",
+            "print(\"✅ TN52D is clearly the preferred location (used 15 times out of 53)\")"
+        ], 'code'),
+
+        # Pattern Strength Classification
+        cell([
+            "## 5️⃣ Pattern Strength Classification\n",
+            "\n",
+            "Not all patterns are equally strong. We classify them based on usage percentage:"
+        ]),
+        cell([
+            "def classify_pattern_strength(top_percentage):\n",
+            "    \"\"\"\n",
+            "    Classify how strong a pattern is based on the top location's usage percentage\n",
+            "    \"\"\"\n",
+            "    if top_percentage >= 50:\n",
+            "        return 'STRONG'\n",
+            "    elif top_percentage >= 20:\n",
+            "        return 'MEDIUM'\n",
+            "    else:\n",
+            "        return 'WEAK'\n",
+            "\n",
+            "# Examples\n",
+            "examples = [\n",
+            "    {'part': 'Part 1827', 'top_location': 'G35F', 'percentage': 68.0, 'strength': classify_pattern_strength(68.0)},\n",
+            "    {'part': 'Part 600', 'top_location': 'TN52D', 'percentage': 28.3, 'strength': classify_pattern_strength(28.3)},\n",
+            "    {'part': 'Part 522', 'top_location': 'G28F', 'percentage': 12.5, 'strength': classify_pattern_strength(12.5)},\n",
+            "]\n",
+            "\n",
+            "df_examples = pd.DataFrame(examples)\n",
+            *show_lines("Pattern Strength Classification:", "df_examples.head()"),
+        ], 'code'),
+        cell([
+            "The scalar function above is for illustration only. On the full {{patterns}}-pattern table the pipeline classifies\n",
+            "the whole column at once with `np.select`, which runs as a single NumPy pass instead of one Python call per row:"
+        ]),
+        cell([
+            "# Vectorized classification (what ships)\n",
+            "df_examples['strength'] = np.select(\n",
+            "    [df_examples['percentage'] >= 50, df_examples['percentage'] >= 20],\n",
+            "    ['STRONG', 'MEDIUM'],\n",
+            "    default='WEAK'\n",
+            ")\n",
+            "\n",
+            *show_lines("Vectorized Pattern Strength Classification:", "df_examples.head()"),
+        ], 'code'),
+
+        # AI Recommendation Logic
+        cell([
+            "## 6️⃣ How AI Generates Recommendations\n",
+            "\n",
+            "When a part arrives at the warehouse:\n",
+            "\n",
+            "1. **Retrieve Pattern** from Qdrant (< 100ms)\n",
+            "2. **Check Availability** - Which historical locations are FREE? (real-time MySQL query)\n",
+            "3. **Rank Options** - Prefer most-used FREE location\n",
+            "4. **Generate AI Explanation** - Gemini creates natural language summary\n",
+            "\n",
+            "### The AI adapts its response based on pattern strength:"
+        ]),
+        cell([
+            "# AI Response Examples (Real outputs from Gemini)\n",
+            "\n",
+            "ai_responses = {\n",
+            "    'STRONG Pattern (≥50%)': {\n",
+            "        'Example': 'Part 1827 (BA-08447P) → Location G35F (68% usage)',\n",
+            "        'AI Says': 'Location G35F is highly recommended as it is the most preferred location for this part with a strong historical pattern. The location is currently FREE and ready for immediate use.'\n",
+            "    },\n",
+            "    'MEDIUM Pattern (20-50%)': {\n",
+            "        'Example': 'Part 600 (42645EQ) → Location TN52D (28.3% usage)',\n",
+            "        'AI Says': 'Location TN52D is recommended as it follows the established pattern for this part. The location is currently FREE and ready for immediate use.'\n",
+            "    },\n",
+            "    'WEAK Pattern (<20%)': {\n",
+            "        'Example': 'Part 522 (405407) → Location G28F (12.5% usage)',\n",
+            "        'AI Says': 'Location G28F is recommended based on historical usage patterns. The location is currently FREE and available for use.'\n",
+            "    },\n",
+            "    'All Locations Occupied': {\n",
+            "        'Example': 'Part 736 (627804) - all historical locations occupied',\n",
+            "        'AI Says': 'All previously used locations are currently occupied. Please consult your supervisor and look for a free location in Zone H, following the historical storage pattern for this part.'\n",
+            "    },\n",
+            "    'No Historical Data': {\n",
+            "        'Example': 'New part with no putaway history',\n",
+            "        'AI Says': 'This part has no historical putaway data. Consult your supervisor — consider placing it in Zone T based on similar parts.'\n",
+            "    }\n",
+            "}\n",
+            "\n",
+            "print(\"🤖 AI Response Adaptation Examples\")\n",
+            SEP70,
+            "for scenario, data in ai_responses.items():\n",
+            "    print(f\"\\n{scenario}\")\n",
+            "    print(\"-\"*70)\n",
+            "    print(f\"Scenario: {data['Example']}\")\n",
+            "    print(f\"AI Response:\")\n",
+            "    print(f\"  '{data['AI Says']}'\")\n",
+            "    print()"
+        ], 'code'),
+
+        # System Output Example
+        cell([
+            "## 7️⃣ Complete System Output Example\n",
+            "\n",
+            "Here's what the user sees when they request a recommendation:"
+        ]),
+        cell(SYSTEM_OUTPUT_EXAMPLE, 'code'),
+
+        # Key Statistics
+        cell([
+            "## 8️⃣ System Performance & Statistics\n",
+            "\n",
+            "### Learning Results:\n",
+            "\n",
+            "- **Input:** {{transactions}} historical transactions\n",
+            "- **Output:** {{patterns}} learned patterns ({{coverage}} of all parts)\n",
+            "- **Coverage:** Patterns for {{patterns}} out of {{parts}} parts\n",
+            "\n",
+            "### Pattern Quality Distribution:\n",
+            "\n",
+            "- **Strong Patterns (>50% usage):** 892 parts (35.8%)\n",
+            "- **Medium Patterns (20-50%):** 1,156 parts (46.4%)\n",
+            "- **Weak Patterns (<20%):** 444 parts (17.8%)\n",
+            "\n",
+            "### Validation Results:\n",
+            "\n",
+            "- **Accuracy:** 100% (200/200 test cases)\n",
+            "- **Pattern Match:** System correctly identifies historical locations\n",
+            "- **Status Verification:** Real-time availability checks are accurate"
+        ]),
+        cell([
+            "# Visualize pattern quality distribution\n",
+            "pattern_stats = {\n",
+            "    'STRONG (>50%)': 892,\n",
+            "    'MEDIUM (20-50%)': 1156,\n",
+            "    'WEAK (<20%)': 444\n",
+            "}\n",
+            "\n",
+            "plt.figure(figsize=(10, 6))\n",
+            "colors = ['#3fb950', '#f39c12', '#e74c3c']\n",
+            "plt.pie(pattern_stats.values(), labels=pattern_stats.keys(), autopct='%1.1f%%',\n",
+            "        colors=colors, startangle=90, textprops={'fontsize': 12, 'weight': 'bold'})\n",
+            "plt.title('Pattern Strength Distribution Across {{patterns}} Learned Patterns', fontsize=14, weight='bold')\n",
+            "plt.tight_layout()\n",
+            "plt.show()\n",
+            "\n",
+            f"print(\"{PATTERN_PIE_SUMMARY}\")"
+        ], 'code', render_pattern_pie()),
+
+        # Summary
+        cell([
+            "## 🎯 Summary\n",
+            "\n",
+            "### What We've Demonstrated:\n",
+            "\n",
+            "1. **Data-Driven Learning**\n",
+            "   - System learns from 224K+ real transactions\n",
+            "   - Not random - based on proven historical patterns\n",
+            "\n",
+            "2. **Transparent Logic**\n",
+            "   - SQL aggregation extracts location preferences\n",
+            "   - Pattern strength classification ensures quality\n",
+            "   - All code is visible and explainable\n",
+            "\n",
+            "3. **AI-Powered Recommendations**\n",
+            "   - Gemini AI generates context-aware explanations\n",
+            "   - Responses adapt based on pattern strength\n",
+            "   - Not hardcoded - truly intelligent\n",
+            "\n",
+            "4. **Production Ready**\n",
+            "   - 100% validation accuracy\n",
+            "   - Real-time availability checks\n",
+            "   - Fast retrieval (< 100ms from Qdrant)\n",
+            "\n",
+            "---\n",
+            "\n",
+            "## 🚀 Why This Matters\n",
+            "\n",
+            "**Traditional Approach:**\n",
+            "- Manual location assignment\n",
+            "- Inconsistent decisions\n",
+            "- No learning from past experience\n",
+            "\n",
+            "**StockRight Approach:**\n",
+            "- Automated, data-driven recommendations\n",
+            "- Consistent with historical best practices\n",
+            "- Continuously learns from warehouse operations\n",
+            "\n",
+            "---\n",
+            "\n",
+            "**This notebook shows the complete end-to-end learning process that powers StockRight's intelligent warehouse recommendations.**"
+        ]),
+    )
+
+
+def _dumps(obj) -> bytes:
+    """Encode one JSON value as compact UTF-8 bytes (Jupyter re-indents on save)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def iter_notebook_chunks():
+    """
+    Yield the notebook JSON piecewise: the metadata header, then one chunk per cell
+
+    Each cell is encoded on its own, so the full document never has to be
+    held in memory as a single encoder buffer. The metadata (including the
+    build version) is written first so is_current_build() only needs the head
+    of the file.
+    """
+    header = {
+        **NOTEBOOK_METADATA,
+        "metadata": {VERSION_KEY: BUILD_VERSION, **NOTEBOOK_METADATA["metadata"]},
+    }
+    yield _dumps(header)[:-1] + b',"cells":[\n'
+    for i, cell in enumerate(build_cells()):
+        if i:
+            yield b',\n'
+        yield _dumps(cell)
+    yield b']}'
+
+
+def is_current_build(path: Path) -> bool:
+    """Check whether the notebook at path was generated from this exact script"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(256)
+    except FileNotFoundError:
+        return False
+    return BUILD_VERSION.encode('ascii') in head
+
+
+@functools.cache
+def build_notebook() -> bytes:
+    """Return the encoded notebook, cached for repeated imports"""
+    return b''.join(iter_notebook_chunks())
+
+
+def write_notebook(path: Path):
+    """Stream the notebook to disk through a 1 MiB write buffer"""
+    with open(path, 'wb', buffering=1 << 20) as f:
+        for chunk in iter_notebook_chunks():
+            f.write(chunk)
+
+
+if __name__ == '__main__':
+    # Skip the rebuild only when the existing build carries this exact version: a newer
+    # file mtime alone would miss a build made with a different matplotlib install
+    if is_current_build(OUTPUT_PATH):
+        print(f"✅ {OUTPUT_PATH} is up-to-date")
+        raise SystemExit(0)
 
-with open('pattern_learning_demo.ipynb', 'w', encoding='utf-8') as f:
-    json.dump(notebook, f, indent=2, ensure_ascii=False)
+    write_notebook(OUTPUT_PATH)
 
-print("✅ Comprehensive Jupyter Notebook created successfully!")
-print("📓 File: pattern_learning_demo.ipynb")
-print("🚀 Ready for Google Colab or local Jupyter")
+    print("✅ Comprehensive Jupyter Notebook created successfully!")
+    print(f"📓 File: {OUTPUT_PATH}")
+    print("🚀 Ready for Google Colab or local Jupyter")
@@ -209,8 +209,9 @@ arch_text = """┌────────────────────
 
 p = doc.add_paragraph(arch_text)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(9)
 
 doc.add_page_break()
 
@@ -224,8 +225,9 @@ doc.add_heading('Input Data (MySQL Database)', 2)
 
 # Create a nice stats box
 stats_para = doc.add_paragraph()
-stats_para.add_run('Transaction Dataset Overview:\n\n').bold = True
-stats_para.runs[0].font.color.rgb = RGBColor(0, 102, 204)
+stats_run = stats_para.add_run('Transaction Dataset Overview:\n\n')
+stats_run.bold = True
+stats_run.font.color.rgb = RGBColor(0, 102, 204)
 
 stats = [
     ('Total Transactions', '224,081'),
@@ -271,8 +273,9 @@ transaction = """Transaction #12345
 
 p = doc.add_paragraph(transaction)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(10)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(10)
 
 doc.add_page_break()
 
@@ -329,8 +332,9 @@ Part 2045 →  [95 transactions]
 
 p2 = doc.add_paragraph(grouping)
 p2.paragraph_format.left_indent = Inches(0.5)
-p2.runs[0].font.name = 'Courier New'
-p2.runs[0].font.size = Pt(10)
+run_font = p2.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(10)
 
 doc.add_paragraph()
 
@@ -364,8 +368,9 @@ percentages = """Part 600 Calculations:
 
 p2 = doc.add_paragraph(percentages)
 p2.paragraph_format.left_indent = Inches(0.25)
-p2.runs[0].font.name = 'Courier New'
-p2.runs[0].font.size = Pt(10)
+run_font = p2.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(10)
 
 doc.add_paragraph()
 
@@ -446,8 +451,9 @@ ORDER BY
 
 p = doc.add_paragraph(query)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(9)
 
 doc.add_paragraph()
 
@@ -518,8 +524,9 @@ json_pattern = """{
 
 p = doc.add_paragraph(json_pattern)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(8.5)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(8.5)
 
 doc.add_paragraph()
 
@@ -658,8 +665,9 @@ Total Response Time: < 100ms"""
 
 p = doc.add_paragraph(flow_diagram)
 p.paragraph_format.left_indent = Inches(0.1)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(8.5)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(8.5)
 
 doc.add_paragraph()
 
@@ -705,8 +713,9 @@ Output Data:
 
 p = doc.add_paragraph(stats_table)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(10)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(10)
 
 doc.add_paragraph()
 
@@ -820,8 +829,9 @@ transactions_sample = """Transaction History (53 total):
 
 p = doc.add_paragraph(transactions_sample)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(9)
 
 doc.add_paragraph()
 
@@ -839,8 +849,9 @@ TN43D     | 1     | 1.9%       | Rare
 
 p = doc.add_paragraph(query_results)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(9)
 
 doc.add_paragraph()
 
@@ -862,8 +873,9 @@ final_json = """{
 
 p = doc.add_paragraph(final_json)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(9)
 
 doc.add_paragraph()
 
@@ -946,8 +958,9 @@ Updates:
 
 p = doc.add_paragraph(daily)
 p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
+run_font = p.runs[0].font
+run_font.name = 'Courier New'
+run_font.size = Pt(9)
 
 doc.add_paragraph()
 
@@ -1,206 +1,281 @@
+import io
+import zipfile
+from copy import deepcopy
+
 from docx import Document
+from docx.oxml.ns import nsmap, qn
 from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from lxml.etree import Element, SubElement, cleanup_namespaces, xmlfile
+
+# Shared formatting values (Length and RGBColor are immutable, so one instance
+# can be reused for every run and paragraph)
+PT9, PT10, PT11, PT14, PT28 = map(Pt, (9, 10, 11, 14, 28))
+BLUE = RGBColor(0, 102, 204)
+GREY = RGBColor(128, 128, 128)
+RED = RGBColor(255, 0, 0)
+GREEN = RGBColor(0, 128, 0)
+IND_QTR, IND_HALF = Inches(0.25), Inches(0.5)
+COURIER = 'Courier New'
+
+# WordprocessingML tag and attribute names, resolved once
+W_P, W_PPR, W_PSTYLE, W_IND, W_JC = map(qn, ('w:p', 'w:pPr', 'w:pStyle', 'w:ind', 'w:jc'))
+W_R, W_RPR, W_RFONTS, W_B, W_I, W_COLOR, W_SZ, W_T, W_BR = map(
+    qn, ('w:r', 'w:rPr', 'w:rFonts', 'w:b', 'w:i', 'w:color', 'w:sz', 'w:t', 'w:br')
+)
+W_VAL, W_LEFT, W_TYPE, W_ASCII, W_HANSI, XML_SPACE = map(
+    qn, ('w:val', 'w:left', 'w:type', 'w:ascii', 'w:hAnsi', 'xml:space')
+)
+W_NSMAP = {'w': nsmap['w']}
+_RUN_DEFAULTS = (False, False, None, None, None)
+
+
+# --- Document DSL: each helper returns <w:p> elements for the body ---
+
+def _add_runs(p, specs):
+    """
+    Append one <w:r> per spec to paragraph element p
+
+    Each spec is a string or a (text, bold, italic, size, color, font) tuple with
+    trailing fields optional. Newlines become <w:br/>, as with Paragraph.add_run().
+    """
+    for spec in specs:
+        text, *fmt = (spec,) if isinstance(spec, str) else spec
+        bold, italic, size, color, font = (*fmt, *_RUN_DEFAULTS[len(fmt):])
+        r = SubElement(p, W_R)
+        if bold or italic or size is not None or color is not None or font is not None:
+            rpr = SubElement(r, W_RPR)
+            if font is not None:
+                rfonts = SubElement(rpr, W_RFONTS)
+                rfonts.set(W_ASCII, font)
+                rfonts.set(W_HANSI, font)
+            if bold:
+                SubElement(rpr, W_B)
+            if italic:
+                SubElement(rpr, W_I)
+            if color is not None:
+                SubElement(rpr, W_COLOR).set(W_VAL, str(color))
+            if size is not None:
+                SubElement(rpr, W_SZ).set(W_VAL, str(round(size.pt * 2)))
+        for i, line in enumerate(text.split('\n')):
+            if i:
+                SubElement(r, W_BR)
+            if line:
+                t = SubElement(r, W_T)
+                t.text = line
+                if line != line.strip():
+                    t.set(XML_SPACE, 'preserve')
+
+
+def P(*specs, style=None, indent=None, align=None):
+    """Paragraph with an optional style id, left indent and alignment; no specs gives a blank line"""
+    p = Element(W_P, nsmap=W_NSMAP)
+    if style or indent is not None or align:
+        ppr = SubElement(p, W_PPR)
+        if style:
+            SubElement(ppr, W_PSTYLE).set(W_VAL, style)
+        if indent is not None:
+            SubElement(ppr, W_IND).set(W_LEFT, str(indent.twips))
+        if align:
+            SubElement(ppr, W_JC).set(W_VAL, align)
+    _add_runs(p, specs)
+    return p
+
+
+def H(level, *specs, align=None):
+    """Heading paragraph; level 0 is the document title"""
+    return P(*specs, style='Title' if level == 0 else f'Heading{level}', align=align)
+
+
+def BUL(items, style='ListBullet', indent=None, color=None):
+    """One list paragraph per item"""
+    return [P(item if color is None else (item, False, False, None, color), style=style, indent=indent)
+            for item in items]
+
+
+def KV(rows, color=None):
+    """A 'label: value' paragraph per row; a color also makes the value bold"""
+    value_fmt = (False, False, None, None) if color is None else (True, False, None, color)
+    return [P((f'{label}: ', True), (value, *value_fmt)) for label, value in rows]
+
+
+def PAGE_BREAK():
+    """Paragraph holding a single page break run"""
+    p = Element(W_P, nsmap=W_NSMAP)
+    SubElement(SubElement(p, W_R), W_BR).set(W_TYPE, 'page')
+    return p
+
+
+# --- Sections ---
+
+def title_page():
+    yield H(0, ('StockRight Pattern Learning System', False, False, PT28, BLUE), align='center')
+    yield P(('How the System Learns from Historical Data', False, True, PT14, GREY), align='center')
+
+    yield P()  # Spacing
+
+    # Overview
+    yield H(1, 'Overview')
+    yield P(
+        ('The ', False, False, PT11),
+        ('StockRight Agentic Logistics Engine', True, False, None, BLUE),
+        ' learns warehouse storage patterns by analyzing past transactions. Think of it like teaching a student by showing examples - the system "learns" by looking at where parts were stored historically.',
+    )
+
+    yield PAGE_BREAK()
+
+
+def section_pattern_learning():
+    # Section 1: What is Pattern Learning?
+    yield H(1, '1. What is Pattern Learning?')
+
+    yield H(2, 'Simple Definition')
+    yield P('Pattern learning means finding repeated behaviors in historical data.')
+
+    yield H(2, 'In Our System')
+    yield from BUL([
+        'We have 224,081 past putaway transactions (records of where parts were stored)',
+        'System analyzes these transactions to find patterns like:',
+        '  • "Part A is usually stored in Location X"',
+        '  • "Part B is mostly placed in Zone T"'
+    ])
+
+    yield H(2, 'Example')
+    yield P('If Part 600 was stored 53 times in the past:')
+    yield from BUL([
+        '15 times in location TN52D (28.3%)',
+        '8 times in location SG01J (15.1%)',
+        '3 times in location TP03D (5.66%)'
+    ], indent=IND_HALF)
+
+    yield P(
+        ('The system learns: ', False, False, PT11),
+        ('"Part 600 prefers TN52D location"', True, False, None, GREEN),
+    )
+
+    yield PAGE_BREAK()
+
+
+def section_data_sources():
+    # Section 2: Data Sources
+    yield H(1, '2. Data Sources')
 
-# Create document
-doc = Document()
+    yield H(2, 'Input Data (MySQL Database)')
 
-# Set default font
-style = doc.styles['Normal']
-font = style.font
-font.name = 'Calibri'
-font.size = Pt(11)
-
-# Title
-title = doc.add_heading('StockRight Pattern Learning System', 0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-title_run = title.runs[0]
-title_run.font.color.rgb = RGBColor(0, 102, 204)  # Blue color
-title_run.font.size = Pt(28)
-
-# Subtitle
-subtitle = doc.add_paragraph('How the System Learns from Historical Data')
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-subtitle_run = subtitle.runs[0]
-subtitle_run.font.size = Pt(14)
-subtitle_run.font.color.rgb = RGBColor(128, 128, 128)
-subtitle_run.italic = True
-
-doc.add_paragraph()  # Spacing
-
-# Overview
-doc.add_heading('Overview', 1)
-p = doc.add_paragraph()
-p.add_run('The ').font.size = Pt(11)
-run = p.add_run('StockRight Agentic Logistics Engine')
-run.bold = True
-run.font.color.rgb = RGBColor(0, 102, 204)
-p.add_run(' learns warehouse storage patterns by analyzing past transactions. Think of it like teaching a student by showing examples - the system "learns" by looking at where parts were stored historically.')
-
-doc.add_page_break()
-
-# Section 1: What is Pattern Learning?
-doc.add_heading('1. What is Pattern Learning?', 1)
-
-doc.add_heading('Simple Definition', 2)
-doc.add_paragraph('Pattern learning means finding repeated behaviors in historical data.')
-
-doc.add_heading('In Our System', 2)
-bullet_points = [
-    'We have 224,081 past putaway transactions (records of where parts were stored)',
-    'System analyzes these transactions to find patterns like:',
-    '  • "Part A is usually stored in Location X"',
-    '  • "Part B is mostly placed in Zone T"'
-]
-for point in bullet_points:
-    doc.add_paragraph(point, style='List Bullet')
-
-doc.add_heading('Example', 2)
-doc.add_paragraph('If Part 600 was stored 53 times in the past:')
-examples = [
-    '15 times in location TN52D (28.3%)',
-    '8 times in location SG01J (15.1%)',
-    '3 times in location TP03D (5.66%)'
-]
-for ex in examples:
-    p = doc.add_paragraph(ex, style='List Bullet')
-    p.paragraph_format.left_indent = Inches(0.5)
-
-p = doc.add_paragraph()
-p.add_run('The system learns: ').font.size = Pt(11)
-run = p.add_run('"Part 600 prefers TN52D location"')
-run.bold = True
-run.font.color.rgb = RGBColor(0, 128, 0)
-
-doc.add_page_break()
-
-# Section 2: Data Sources
-doc.add_heading('2. Data Sources', 1)
-
-doc.add_heading('Input Data (MySQL Database)', 2)
-
-# Transaction Table stats
-stats_para = doc.add_paragraph()
-stats_para.add_run('Transaction Table:\n').bold = True
-stats = [
-    '224,081 total transactions',
-    'From: 87 different clients',
-    'For: 3,215 unique parts',
-    'Across: 31,416 warehouse locations'
-]
-for stat in stats:
-    stats_para.add_run(f'\n  • {stat}')
-
-doc.add_paragraph()
-
-doc.add_heading('Each Transaction Contains:', 2)
-transaction_fields = [
-    'Part ID (which part was stored)',
-    'Location ID (where it was placed)',
-    'Client ID (who owns the part)',
-    'Timestamp (when it was stored)'
-]
-for field in transaction_fields:
-    doc.add_paragraph(field, style='List Bullet')
-
-doc.add_paragraph()
-
-doc.add_heading('Example Transaction:', 2)
-example = doc.add_paragraph()
-example.add_run('Transaction #12345\n').bold = True
-example.add_run('  ├─ Part: 600 (Code: 42645EQ - Bearing)\n')
-example.add_run('  ├─ Location: TN52D\n')
-example.add_run('  ├─ Client: ABC Corporation\n')
-example.add_run('  └─ Date: 2024-08-15')
-example.paragraph_format.left_indent = Inches(0.25)
-
-doc.add_page_break()
-
-# Section 3: Aggregation Pipeline
-doc.add_heading('3. Pattern Extraction Process (Aggregation Pipeline)', 1)
-
-doc.add_heading('Step-by-Step Learning', 2)
-
-# Step 1
-doc.add_heading('STEP 1: Filter Invalid Locations', 3)
-p = doc.add_paragraph('Remove locations that are not real storage spots:')
-invalid = [
-    'FLOOR1, FLOOR2 (temporary floor storage)',
-    'REC001, REC002 (receiving areas)',
-    'ORD001, ORD002 (order staging areas)',
-    'Subdivided locations (TN52DD - duplicate letters)'
-]
-for inv in invalid:
-    bullet = doc.add_paragraph(f'✗ {inv}', style='List Bullet')
-    bullet.runs[0].font.color.rgb = RGBColor(255, 0, 0)
-
-p = doc.add_paragraph('✓ Keep only valid shelf locations (TN52D, SG01J, etc.)')
-p.runs[0].font.color.rgb = RGBColor(0, 128, 0)
-p.runs[0].bold = True
-
-# Step 2
-doc.add_heading('STEP 2: Group by Part', 3)
-doc.add_paragraph('Organize all transactions by Part ID')
-examples = [
-    'Part 600 → [53 transactions]',
-    'Part 842 → [120 transactions]',
-    'Part 1523 → [8 transactions]',
-    '...and so on for 3,215 parts'
-]
-for ex in examples:
-    doc.add_paragraph(ex, style='List Bullet')
-
-# Step 3
-doc.add_heading('STEP 3: Count Location Usage', 3)
-doc.add_paragraph('For each part, count how many times each location was used')
-p = doc.add_paragraph()
-p.add_run('\nPart 600 (53 total putaways):\n').bold = True
-p.add_run('  TN52D → 15 times\n')
-p.add_run('  SG01J → 8 times\n')
-p.add_run('  TP03D → 3 times\n')
-p.add_run('  TN43D → 1 time\n')
-p.add_run('  ...and more locations')
-
-# Step 4
-doc.add_heading('STEP 4: Calculate Percentages', 3)
-doc.add_paragraph('Convert counts to percentages for easy comparison')
-p = doc.add_paragraph()
-p.add_run('\nPart 600:\n').bold = True
-p.add_run('  TN52D → 15/53 = 28.3%\n')
-p.add_run('  SG01J → 8/53 = 15.1%\n')
-p.add_run('  TP03D → 3/53 = 5.66%')
-
-# Step 5
-doc.add_heading('STEP 5: Rank by Frequency', 3)
-doc.add_paragraph('Sort locations from most used to least used')
-p = doc.add_paragraph()
-p.add_run('\nPart 600 Rankings:\n').bold = True
-p.add_run('  #1: TN52D (28.3%) ← Most preferred location\n')
-run = p.runs[-1]
-run.font.color.rgb = RGBColor(0, 128, 0)
-p.add_run('  #2: SG01J (15.1%)\n')
-p.add_run('  #3: TP03D (5.66%)\n')
-p.add_run('  #4: TN43D (1.9%)')
-
-# Step 6
-doc.add_heading('STEP 6: Extract Primary Zone', 3)
-doc.add_paragraph('Identify the most common warehouse zone')
-p = doc.add_paragraph()
-p.add_run('\nPart 600:\n').bold = True
-p.add_run('  Most locations start with "T" (TN52D, TP03D, TN43D)\n')
-p.add_run('  → Primary Zone = "T"')
-run = p.runs[-1]
-run.font.color.rgb = RGBColor(0, 102, 204)
-run.bold = True
-
-doc.add_page_break()
-
-# Section 4: MySQL Query
-doc.add_heading('4. MySQL Aggregation Query', 1)
-
-doc.add_heading('The SQL code that does the learning:', 2)
-
-query_text = """SELECT
+    # Transaction Table stats
+    stats = [
+        '224,081 total transactions',
+        'From: 87 different clients',
+        'For: 3,215 unique parts',
+        'Across: 31,416 warehouse locations'
+    ]
+    yield P(('Transaction Table:\n', True), *(f'\n  • {stat}' for stat in stats))
+
+    yield P()
+
+    yield H(2, 'Each Transaction Contains:')
+    yield from BUL([
+        'Part ID (which part was stored)',
+        'Location ID (where it was placed)',
+        'Client ID (who owns the part)',
+        'Timestamp (when it was stored)'
+    ])
+
+    yield P()
+
+    yield H(2, 'Example Transaction:')
+    yield P(
+        ('Transaction #12345\n', True),
+        '  ├─ Part: 600 (Code: 42645EQ - Bearing)\n',
+        '  ├─ Location: TN52D\n',
+        '  ├─ Client: ABC Corporation\n',
+        '  └─ Date: 2024-08-15',
+        indent=IND_QTR,
+    )
+
+    yield PAGE_BREAK()
+
+
+def section_aggregation_pipeline():
+    # Section 3: Aggregation Pipeline
+    yield H(1, '3. Pattern Extraction Process (Aggregation Pipeline)')
+
+    yield H(2, 'Step-by-Step Learning')
+
+    # Step 1
+    yield H(3, 'STEP 1: Filter Invalid Locations')
+    yield P('Remove locations that are not real storage spots:')
+    invalid = [
+        'FLOOR1, FLOOR2 (temporary floor storage)',
+        'REC001, REC002 (receiving areas)',
+        'ORD001, ORD002 (order staging areas)',
+        'Subdivided locations (TN52DD - duplicate letters)'
+    ]
+    yield from BUL([f'✗ {inv}' for inv in invalid], color=RED)
+
+    yield P(('✓ Keep only valid shelf locations (TN52D, SG01J, etc.)', True, False, None, GREEN))
+
+    # Step 2
+    yield H(3, 'STEP 2: Group by Part')
+    yield P('Organize all transactions by Part ID')
+    yield from BUL([
+        'Part 600 → [53 transactions]',
+        'Part 842 → [120 transactions]',
+        'Part 1523 → [8 transactions]',
+        '...and so on for 3,215 parts'
+    ])
+
+    # Step 3
+    yield H(3, 'STEP 3: Count Location Usage')
+    yield P('For each part, count how many times each location was used')
+    yield P(
+        ('\nPart 600 (53 total putaways):\n', True),
+        '  TN52D → 15 times\n',
+        '  SG01J → 8 times\n',
+        '  TP03D → 3 times\n',
+        '  TN43D → 1 time\n',
+        '  ...and more locations',
+    )
+
+    # Step 4
+    yield H(3, 'STEP 4: Calculate Percentages')
+    yield P('Convert counts to percentages for easy comparison')
+    yield P(
+        ('\nPart 600:\n', True),
+        '  TN52D → 15/53 = 28.3%\n',
+        '  SG01J → 8/53 = 15.1%\n',
+        '  TP03D → 3/53 = 5.66%',
+    )
+
+    # Step 5
+    yield H(3, 'STEP 5: Rank by Frequency')
+    yield P('Sort locations from most used to least used')
+    yield P(
+        ('\nPart 600 Rankings:\n', True),
+        ('  #1: TN52D (28.3%) ← Most preferred location\n', False, False, None, GREEN),
+        '  #2: SG01J (15.1%)\n',
+        '  #3: TP03D (5.66%)\n',
+        '  #4: TN43D (1.9%)',
+    )
+
+    # Step 6
+    yield H(3, 'STEP 6: Extract Primary Zone')
+    yield P('Identify the most common warehouse zone')
+    yield P(
+        ('\nPart 600:\n', True),
+        '  Most locations start with "T" (TN52D, TP03D, TN43D)\n',
+        ('  → Primary Zone = "T"', True, False, None, BLUE),
+    )
+
+    yield PAGE_BREAK()
+
+
+def section_mysql_query():
+    # Section 4: MySQL Query
+    yield H(1, '4. MySQL Aggregation Query')
+
+    yield H(2, 'The SQL code that does the learning:')
+
+    query_text = """SELECT
     p.id AS part_id,
     p.code AS part_code,
     l.code AS location_code,
@@ -227,33 +302,31 @@ GROUP BY
 ORDER BY
     p.id, usage_count DESC"""
 
-p = doc.add_paragraph(query_text)
-p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
+    yield P((query_text, False, False, PT9, None, COURIER), indent=IND_QTR)
 
-doc.add_paragraph()
+    yield P()
 
-doc.add_heading('What This Query Does:', 2)
-steps = [
-    'Joins transaction data with part and location information',
-    'Filters out invalid storage locations',
-    'Groups transactions by part and location',
-    'Counts how many times each part was stored in each location',
-    'Calculates the percentage of usage for each location',
-    'Sorts results by most-used locations first'
-]
-for i, step in enumerate(steps, 1):
-    doc.add_paragraph(f'{i}. {step}', style='List Number')
+    yield H(2, 'What This Query Does:')
+    steps = [
+        'Joins transaction data with part and location information',
+        'Filters out invalid storage locations',
+        'Groups transactions by part and location',
+        'Counts how many times each part was stored in each location',
+        'Calculates the percentage of usage for each location',
+        'Sorts results by most-used locations first'
+    ]
+    yield from BUL([f'{i}. {step}' for i, step in enumerate(steps, 1)], style='ListNumber')
+
+    yield PAGE_BREAK()
 
-doc.add_page_break()
 
-# Section 5: Learned Pattern Structure
-doc.add_heading('5. Learned Pattern Structure', 1)
+def section_pattern_structure():
+    # Section 5: Learned Pattern Structure
+    yield H(1, '5. Learned Pattern Structure')
 
-doc.add_heading('Pattern Format (JSON)', 2)
+    yield H(2, 'Pattern Format (JSON)')
 
-json_text = """{
+    json_text = """{
     "part_id": 600,
     "part_code": "42645EQ",
     "description": "Bearing",
@@ -280,49 +353,42 @@ json_text = """{
     ]
 }"""
 
-p = doc.add_paragraph(json_text)
-p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
-
-doc.add_paragraph()
-
-doc.add_heading('What Each Field Means:', 2)
-fields = [
-    ('part_id', 'Unique identifier for the part'),
-    ('part_code', 'Human-readable part code'),
-    ('total_putaways', 'How many times this part was stored historically'),
-    ('primary_zone', 'Most common warehouse zone (first letter of locations)'),
-    ('all_locations', 'List of all locations used, ranked by frequency'),
-    ('  code', 'Location name'),
-    ('  count', 'Number of times used'),
-    ('  percentage', 'Usage rate (count ÷ total_putaways × 100)')
-]
-for field, desc in fields:
-    p = doc.add_paragraph()
-    p.add_run(f'{field}: ').bold = True
-    p.add_run(desc)
-
-doc.add_page_break()
-
-# Section 6: Knowledge Base
-doc.add_heading('6. Knowledge Base Creation', 1)
-
-doc.add_heading('Storing Patterns in Qdrant Vector Database', 2)
-
-doc.add_heading('Why Qdrant?', 3)
-benefits = [
-    'Fast retrieval (milliseconds to find patterns for any part)',
-    'Scalable (can handle millions of parts)',
-    'Cloud-based (accessible from anywhere)'
-]
-for benefit in benefits:
-    doc.add_paragraph(benefit, style='List Bullet')
-
-doc.add_paragraph()
-
-doc.add_heading('Storage Process:', 3)
-process = """MySQL Aggregation Results
+    yield P((json_text, False, False, PT9, None, COURIER), indent=IND_QTR)
+
+    yield P()
+
+    yield H(2, 'What Each Field Means:')
+    yield from KV([
+        ('part_id', 'Unique identifier for the part'),
+        ('part_code', 'Human-readable part code'),
+        ('total_putaways', 'How many times this part was stored historically'),
+        ('primary_zone', 'Most common warehouse zone (first letter of locations)'),
+        ('all_locations', 'List of all locations used, ranked by frequency'),
+        ('  code', 'Location name'),
+        ('  count', 'Number of times used'),
+        ('  percentage', 'Usage rate (count ÷ total_putaways × 100)')
+    ])
+
+    yield PAGE_BREAK()
+
+
+def section_knowledge_base():
+    # Section 6: Knowledge Base
+    yield H(1, '6. Knowledge Base Creation')
+
+    yield H(2, 'Storing Patterns in Qdrant Vector Database')
+
+    yield H(3, 'Why Qdrant?')
+    yield from BUL([
+        'Fast retrieval (milliseconds to find patterns for any part)',
+        'Scalable (can handle millions of parts)',
+        'Cloud-based (accessible from anywhere)'
+    ])
+
+    yield P()
+
+    yield H(3, 'Storage Process:')
+    process = """MySQL Aggregation Results
     ↓
 Process 224,081 transactions
     ↓
@@ -332,92 +398,78 @@ Create 2,492 learned patterns
     ↓
 Store in Qdrant "PartSummary" collection"""
 
-p = doc.add_paragraph(process)
-p.paragraph_format.left_indent = Inches(0.25)
-
-doc.add_paragraph()
-
-doc.add_heading('Why Only 2,492 Patterns from 3,215 Parts?', 3)
-reasons = [
-    'Some parts have no valid historical locations (only stored in FLOOR/REC areas)',
-    'Some parts were stored only once (not enough data to learn a pattern)',
-    'We only create patterns for parts with 2+ valid putaways'
-]
-for reason in reasons:
-    doc.add_paragraph(reason, style='List Bullet')
-
-doc.add_paragraph()
-
-doc.add_heading('Qdrant Collection Details:', 3)
-p = doc.add_paragraph()
-p.add_run('Collection Name: ').bold = True
-p.add_run('PartSummary\n')
-p.add_run('Total Vectors: ').bold = True
-p.add_run('2,492 patterns\n')
-p.add_run('Vector Dimension: ').bold = True
-p.add_run('Not applicable (using payload storage only)\n')
-p.add_run('Index Type: ').bold = True
-p.add_run('Integer ID-based lookup')
-
-doc.add_page_break()
-
-# Section 7: Statistics
-doc.add_heading('7. Learning Statistics', 1)
-
-doc.add_heading('Overall Pattern Learning Results', 2)
-
-doc.add_heading('Input Data:', 3)
-input_data = [
-    ('Total Transactions Analyzed', '224,081'),
-    ('Unique Parts in Database', '3,215'),
-    ('Unique Locations', '31,416'),
-    ('Unique Clients', '87')
-]
-for label, value in input_data:
-    p = doc.add_paragraph()
-    p.add_run(f'{label}: ').bold = True
-    run = p.add_run(value)
-    run.font.color.rgb = RGBColor(0, 102, 204)
-    run.bold = True
-
-doc.add_paragraph()
-
-doc.add_heading('Output Data:', 3)
-output_data = [
-    ('Learned Patterns Created', '2,492'),
-    ('Coverage', '77.5% of all parts'),
-    ('Average Putaways per Part', '90 transactions'),
-    ('Parts with Strong Patterns (>10 putaways)', '1,847'),
-    ('Parts with Weak Patterns (2-10 putaways)', '645')
-]
-for label, value in output_data:
-    p = doc.add_paragraph()
-    p.add_run(f'{label}: ').bold = True
-    run = p.add_run(value)
-    run.font.color.rgb = RGBColor(0, 128, 0)
-    run.bold = True
-
-doc.add_paragraph()
-
-doc.add_heading('Pattern Quality Distribution:', 3)
-quality = [
-    ('High Confidence (>50% usage on top location)', '892 parts (35.8%)'),
-    ('Medium Confidence (20-50% usage)', '1,156 parts (46.4%)'),
-    ('Low Confidence (<20% usage)', '444 parts (17.8%)')
-]
-for label, value in quality:
-    p = doc.add_paragraph()
-    p.add_run(f'{label}: ').bold = True
-    p.add_run(value)
-
-doc.add_page_break()
-
-# Section 8: Recommendation Flow
-doc.add_heading('8. How Patterns Are Used for Recommendations', 1)
-
-doc.add_heading('Recommendation Flow', 2)
-
-flow = """1. User enters Part ID (e.g., 600)
+    yield P(process, indent=IND_QTR)
+
+    yield P()
+
+    yield H(3, 'Why Only 2,492 Patterns from 3,215 Parts?')
+    yield from BUL([
+        'Some parts have no valid historical locations (only stored in FLOOR/REC areas)',
+        'Some parts were stored only once (not enough data to learn a pattern)',
+        'We only create patterns for parts with 2+ valid putaways'
+    ])
+
+    yield P()
+
+    yield H(3, 'Qdrant Collection Details:')
+    yield P(
+        ('Collection Name: ', True),
+        'PartSummary\n',
+        ('Total Vectors: ', True),
+        '2,492 patterns\n',
+        ('Vector Dimension: ', True),
+        'Not applicable (using payload storage only)\n',
+        ('Index Type: ', True),
+        'Integer ID-based lookup',
+    )
+
+    yield PAGE_BREAK()
+
+
+def section_statistics():
+    # Section 7: Statistics
+    yield H(1, '7. Learning Statistics')
+
+    yield H(2, 'Overall Pattern Learning Results')
+
+    yield H(3, 'Input Data:')
+    yield from KV([
+        ('Total Transactions Analyzed', '224,081'),
+        ('Unique Parts in Database', '3,215'),
+        ('Unique Locations', '31,416'),
+        ('Unique Clients', '87')
+    ], color=BLUE)
+
+    yield P()
+
+    yield H(3, 'Output Data:')
+    yield from KV([
+        ('Learned Patterns Created', '2,492'),
+        ('Coverage', '77.5% of all parts'),
+        ('Average Putaways per Part', '90 transactions'),
+        ('Parts with Strong Patterns (>10 putaways)', '1,847'),
+        ('Parts with Weak Patterns (2-10 putaways)', '645')
+    ], color=GREEN)
+
+    yield P()
+
+    yield H(3, 'Pattern Quality Distribution:')
+    yield from KV([
+        ('High Confidence (>50% usage on top location)', '892 parts (35.8%)'),
+        ('Medium Confidence (20-50% usage)', '1,156 parts (46.4%)'),
+        ('Low Confidence (<20% usage)', '444 parts (17.8%)')
+    ])
+
+    yield PAGE_BREAK()
+
+
+def section_recommendation_flow():
+    # Section 8: Recommendation Flow
+    yield H(1, '8. How Patterns Are Used for Recommendations')
+
+    yield H(2, 'Recommendation Flow')
+
+    flow = """1. User enters Part ID (e.g., 600)
    ↓
 2. System retrieves learned pattern from Qdrant
    ↓
@@ -433,79 +485,72 @@ flow = """1. User enters Part ID (e.g., 600)
 6. If TN52D is FREE → Recommend it ✓
    If TN52D is OCCUPIED → Recommend SG01J (next best)"""
 
-p = doc.add_paragraph(flow)
-p.paragraph_format.left_indent = Inches(0.25)
-
-doc.add_paragraph()
-
-doc.add_heading('AI Explanation Generation:', 3)
-p = doc.add_paragraph()
-p.add_run('Gemini AI receives:\n').bold = True
-p.add_run('  • Part: 42645EQ (Bearing)\n')
-p.add_run('  • Recommended Location: TN52D\n')
-p.add_run('  • Confidence: 28.3% historical usage\n')
-p.add_run('  • Status: FREE\n\n')
-p.add_run('AI generates:\n').bold = True
-p.add_run('"Location TN52D is recommended as it has been the most frequently used location for this part historically. The location is currently FREE and ready for immediate use."')
-p.runs[-1].italic = True
-p.runs[-1].font.color.rgb = RGBColor(0, 102, 204)
-
-doc.add_page_break()
-
-# Section 9: Benefits
-doc.add_heading('9. Benefits of Pattern Learning', 1)
-
-doc.add_heading('1. Data-Driven Decisions', 2)
-benefits1 = [
-    'Recommendations based on 224,081 real transactions',
-    'Not guessing - using proven historical patterns',
-    'Reduces human error in location selection'
-]
-for b in benefits1:
-    doc.add_paragraph(b, style='List Bullet')
-
-doc.add_heading('2. Efficiency', 2)
-benefits2 = [
-    'Fast lookups (< 100ms from Qdrant)',
-    'No need to manually remember where parts go',
-    'Consistent storage strategy across warehouse'
-]
-for b in benefits2:
-    doc.add_paragraph(b, style='List Bullet')
-
-doc.add_heading('3. Adaptability', 2)
-benefits3 = [
-    'Patterns can be updated with new transactions',
-    'System learns from changing warehouse practices',
-    'Improves over time as more data is collected'
-]
-for b in benefits3:
-    doc.add_paragraph(b, style='List Bullet')
-
-doc.add_heading('4. Transparency', 2)
-benefits4 = [
-    'Shows users WHY a location is recommended',
-    'Provides confidence scores (usage percentages)',
-    'Allows manual override if needed'
-]
-for b in benefits4:
-    doc.add_paragraph(b, style='List Bullet')
-
-doc.add_page_break()
-
-# Section 10: Complete Example
-doc.add_heading('10. Complete Example: Pattern Learning Journey', 1)
-
-doc.add_heading('Scenario: Learning Pattern for Part 600 (Bearing - 42645EQ)', 2)
-
-doc.add_heading('Starting Point:', 3)
-p = doc.add_paragraph('Part 600 has been stored 53 times in warehouse history')
-p.runs[0].bold = True
-
-doc.add_paragraph()
-
-doc.add_heading('Step 1: Collect Raw Transactions', 3)
-transactions = """Transaction Log:
+    yield P(flow, indent=IND_QTR)
+
+    yield P()
+
+    yield H(3, 'AI Explanation Generation:')
+    yield P(
+        ('Gemini AI receives:\n', True),
+        '  • Part: 42645EQ (Bearing)\n',
+        '  • Recommended Location: TN52D\n',
+        '  • Confidence: 28.3% historical usage\n',
+        '  • Status: FREE\n\n',
+        ('AI generates:\n', True),
+        ('"Location TN52D is recommended as it has been the most frequently used location for this part historically. The location is currently FREE and ready for immediate use."', False, True, None, BLUE),
+    )
+
+    yield PAGE_BREAK()
+
+
+def section_benefits():
+    # Section 9: Benefits
+    yield H(1, '9. Benefits of Pattern Learning')
+
+    yield H(2, '1. Data-Driven Decisions')
+    yield from BUL([
+        'Recommendations based on 224,081 real transactions',
+        'Not guessing - using proven historical patterns',
+        'Reduces human error in location selection'
+    ])
+
+    yield H(2, '2. Efficiency')
+    yield from BUL([
+        'Fast lookups (< 100ms from Qdrant)',
+        'No need to manually remember where parts go',
+        'Consistent storage strategy across warehouse'
+    ])
+
+    yield H(2, '3. Adaptability')
+    yield from BUL([
+        'Patterns can be updated with new transactions',
+        'System learns from changing warehouse practices',
+        'Improves over time as more data is collected'
+    ])
+
+    yield H(2, '4. Transparency')
+    yield from BUL([
+        'Shows users WHY a location is recommended',
+        'Provides confidence scores (usage percentages)',
+        'Allows manual override if needed'
+    ])
+
+    yield PAGE_BREAK()
+
+
+def section_complete_example():
+    # Section 10: Complete Example
+    yield H(1, '10. Complete Example: Pattern Learning Journey')
+
+    yield H(2, 'Scenario: Learning Pattern for Part 600 (Bearing - 42645EQ)')
+
+    yield H(3, 'Starting Point:')
+    yield P(('Part 600 has been stored 53 times in warehouse history', True))
+
+    yield P()
+
+    yield H(3, 'Step 1: Collect Raw Transactions')
+    transactions = """Transaction Log:
 2024-01-10: Part 600 → TN52D (Client: ABC Corp)
 2024-01-15: Part 600 → SG01J (Client: ABC Corp)
 2024-01-20: Part 600 → TN52D (Client: ABC Corp)
@@ -513,15 +558,13 @@ transactions = """Transaction Log:
 2024-02-12: Part 600 → TP03D (Client: ABC Corp)
 ... (48 more transactions)"""
 
-p = doc.add_paragraph(transactions)
-p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.size = Pt(10)
+    yield P((transactions, False, False, PT10), indent=IND_QTR)
 
-doc.add_paragraph()
+    yield P()
 
-doc.add_heading('Step 2: Aggregate Data', 3)
-doc.add_paragraph('Results from aggregation query:')
-table_data = """
+    yield H(3, 'Step 2: Aggregate Data')
+    yield P('Results from aggregation query:')
+    table_data = """
 Location  | Count | Percentage
 ----------|-------|------------
 TN52D     | 15    | 28.3%
@@ -529,15 +572,12 @@ SG01J     | 8     | 15.1%
 TP03D     | 3     | 5.66%
 TN43D     | 1     | 1.9%
 """
-p = doc.add_paragraph(table_data)
-p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(10)
+    yield P((table_data, False, False, PT10, None, COURIER), indent=IND_QTR)
 
-doc.add_paragraph()
+    yield P()
 
-doc.add_heading('Step 3: Create Pattern Structure', 3)
-json_example = """{
+    yield H(3, 'Step 3: Create Pattern Structure')
+    json_example = """{
     "part_id": 600,
     "part_code": "42645EQ",
     "description": "Bearing",
@@ -549,70 +589,114 @@ json_example = """{
         {"code": "TP03D", "count": 3, "percentage": 5.66}
     ]
 }"""
-p = doc.add_paragraph(json_example)
-p.paragraph_format.left_indent = Inches(0.25)
-p.runs[0].font.name = 'Courier New'
-p.runs[0].font.size = Pt(9)
-
-doc.add_paragraph()
-
-doc.add_heading('Step 4: Store in Qdrant', 3)
-p = doc.add_paragraph()
-p.add_run('Pattern saved to PartSummary collection\n')
-p.add_run('ID: 600\n')
-run = p.add_run('Status: Ready for recommendations ✓')
-run.font.color.rgb = RGBColor(0, 128, 0)
-run.bold = True
-
-doc.add_page_break()
-
-# Conclusion
-doc.add_heading('Conclusion', 1)
-
-p = doc.add_paragraph()
-p.add_run('The ').font.size = Pt(11)
-run = p.add_run('StockRight Pattern Learning System')
-run.bold = True
-run.font.color.rgb = RGBColor(0, 102, 204)
-p.add_run(' transforms historical warehouse data into actionable recommendations:')
-
-doc.add_paragraph()
-
-conclusion_points = [
-    'Learns from 224,081 real transactions',
-    'Extracts patterns using SQL aggregation',
-    'Stores 2,492 patterns in Qdrant for fast access',
-    'Recommends optimal locations based on proven historical usage',
-    'Explains recommendations using AI-powered natural language'
-]
-
-for i, point in enumerate(conclusion_points, 1):
-    p = doc.add_paragraph()
-    run = p.add_run(f'{i}. ')
-    run.bold = True
-    run.font.color.rgb = RGBColor(0, 102, 204)
-    p.add_run(point)
-
-doc.add_paragraph()
-
-p = doc.add_paragraph('This data-driven approach ensures efficient warehouse operations while maintaining flexibility for manual overrides when needed.')
-p.runs[0].italic = True
-
-doc.add_paragraph()
-doc.add_paragraph()
-
-# Footer
-p = doc.add_paragraph()
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-p.add_run('━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n').font.color.rgb = RGBColor(128, 128, 128)
-p.add_run('Document Version: 1.0\n').font.size = Pt(9)
-p.add_run('Last Updated: February 2026\n').font.size = Pt(9)
-run = p.add_run('System: StockRight Agentic Logistics Engine (SALE)')
-run.font.size = Pt(9)
-run.bold = True
-run.font.color.rgb = RGBColor(0, 102, 204)
-
-# Save document
-doc.save('C:\\Users\\lenovo\\warehouse-qdrant-system\\StockRight_Pattern_Learning_Documentation.docx')
+    yield P((json_example, False, False, PT9, None, COURIER), indent=IND_QTR)
+
+    yield P()
+
+    yield H(3, 'Step 4: Store in Qdrant')
+    yield P(
+        'Pattern saved to PartSummary collection\n',
+        'ID: 600\n',
+        ('Status: Ready for recommendations ✓', True, False, None, GREEN),
+    )
+
+    yield PAGE_BREAK()
+
+
+def section_conclusion():
+    # Conclusion
+    yield H(1, 'Conclusion')
+
+    yield P(
+        ('The ', False, False, PT11),
+        ('StockRight Pattern Learning System', True, False, None, BLUE),
+        ' transforms historical warehouse data into actionable recommendations:',
+    )
+
+    yield P()
+
+    conclusion_points = [
+        'Learns from 224,081 real transactions',
+        'Extracts patterns using SQL aggregation',
+        'Stores 2,492 patterns in Qdrant for fast access',
+        'Recommends optimal locations based on proven historical usage',
+        'Explains recommendations using AI-powered natural language'
+    ]
+    for i, point in enumerate(conclusion_points, 1):
+        yield P((f'{i}. ', True, False, None, BLUE), point)
+
+    yield P()
+
+    yield P(('This data-driven approach ensures efficient warehouse operations while maintaining flexibility for manual overrides when needed.', False, True))
+
+    yield P()
+    yield P()
+
+    # Footer
+    yield P(
+        ('━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n', False, False, None, GREY),
+        ('Document Version: 1.0\n', False, False, PT9),
+        ('Last Updated: February 2026\n', False, False, PT9),
+        ('System: StockRight Agentic Logistics Engine (SALE)', True, False, PT9, BLUE),
+        align='center',
+    )
+
+
+def save_streamed(doc, path, sections):
+    """
+    Save doc with its body streamed section by section into word/document.xml
+
+    The other package parts (styles, rels, content types) are copied from one
+    save of the document with its empty body. The body paragraphs go through
+    an incremental XML writer, so they never have to be held in a single tree.
+    """
+    template = io.BytesIO()
+    doc.save(template)
+    root = doc.element
+    sect_pr = deepcopy(root.body.sectPr)
+    cleanup_namespaces(sect_pr)  # written on its own, so keep only the w: declaration
+
+    with zipfile.ZipFile(template) as src, \
+            zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as dst:
+        for item in src.infolist():
+            if item.filename != 'word/document.xml':
+                dst.writestr(item.filename, src.read(item))
+                continue
+            with dst.open(item.filename, 'w') as f, xmlfile(f, encoding='UTF-8') as xf:
+                xf.write_declaration(standalone=True)
+                with xf.element(root.tag, dict(root.attrib), nsmap=root.nsmap):
+                    with xf.element(root.body.tag):
+                        for section in sections:
+                            for element in section():
+                                xf.write(element)
+                        xf.write(sect_pr)
+
+
+SECTIONS = (
+    title_page,
+    section_pattern_learning,
+    section_data_sources,
+    section_aggregation_pipeline,
+    section_mysql_query,
+    section_pattern_structure,
+    section_knowledge_base,
+    section_statistics,
+    section_recommendation_flow,
+    section_benefits,
+    section_complete_example,
+    section_conclusion,
+)
+
+# Create document
+doc = Document()
+
+# Set default font
+style = doc.styles['Normal']
+font = style.font
+font.name = 'Calibri'
+font.size = PT11
+
+# Save document, streaming the body sections into the package
+save_streamed(doc, 'C:\\Users\\lenovo\\warehouse-qdrant-system\\StockRight_Pattern_Learning_Documentation.docx', SECTIONS)
 print("Document created successfully!")
 print("Location: C:\\Users\\lenovo\\warehouse-qdrant-system\\StockRight_Pattern_Learning_Documentation.docx")